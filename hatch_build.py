@@ -0,0 +1,62 @@
+"""Hatch build hook: pack the project templates into one versioned archive.
+
+Wheels ship `analyst_toolkit_deploy/templates.zip` (plus a `bundle.json`
+manifest with the package version and member list) instead of the loose
+`templates/` folder, so scaffolding reads the package archive once and
+stays zip/zipapp-safe. Editable installs keep using the source folder.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import tempfile
+import zipfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# Fixed timestamp so identical templates produce a byte-identical archive
+_EPOCH = (2020, 1, 1, 0, 0, 0)
+_SKIP = {"__pycache__", ".DS_Store"}
+
+
+def _template_files(root: Path, src: Path) -> list:
+    """Files to pack: the git-tracked templates, so ignored local files never ship.
+
+    Outside a checkout (building from an sdist, which already honours VCS
+    ignores) every file under `src` is packed.
+    """
+    try:
+        out = subprocess.run(["git", "ls-files", "-z", "--", str(src.relative_to(root))], cwd=root, capture_output=True, check=True)
+        tracked = [root / name for name in out.stdout.decode("utf-8").split("\0") if name]
+    except (OSError, subprocess.CalledProcessError):
+        tracked = list(src.rglob("*"))
+    return sorted(p for p in tracked if p.is_file() and not _SKIP.intersection(p.relative_to(src).parts) and p.suffix != ".pyc")
+
+
+class TemplateBundleHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if self.target_name != "wheel" or version == "editable":
+            return
+        src = Path(self.root) / "src" / "analyst_toolkit_deploy" / "templates"
+        files = _template_files(Path(self.root), src)
+        self._tmp = tempfile.mkdtemp(prefix="templates-bundle-")
+        out = Path(self._tmp) / "templates.zip"
+        names = [p.relative_to(src).as_posix() for p in files]
+        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            manifest = {"version": self.metadata.version, "files": names}
+            zf.writestr(zipfile.ZipInfo("bundle.json", _EPOCH), json.dumps(manifest, indent=2))
+            for path, name in zip(files, names):
+                info = zipfile.ZipInfo(name, _EPOCH)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                zf.writestr(info, path.read_bytes())
+        build_data["force_include"][str(out)] = "analyst_toolkit_deploy/templates.zip"
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        if getattr(self, "_tmp", None):
+            shutil.rmtree(self._tmp, ignore_errors=True)
@@ -0,0 +1,75 @@
+"""Startup benchmark for the CLI entrypoints.
+
+Times cold processes the way an ephemeral container runs them: `--help`,
+scaffolding a project, and inference on a small generated CSV. Run with
+`python -m analyst_toolkit_deploy.benchmark [--budget SECONDS]`; exits 1
+if any step is slower than the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+
+def _timed(cmd: List[str], cwd: str) -> float:
+    """Run `cmd` in a fresh process and return its wall time (best of 3)."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _write_sample(path: str, rows: int = 1000) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["id", "region", "amount", "ordered_at"])
+        for i in range(rows):
+            w.writerow([i, ("north", "south", "east")[i % 3], round(i * 1.25, 2), f"2024-01-{i % 28 + 1:02d}"])
+
+
+def run_benchmark() -> List[Tuple[str, float]]:
+    """Return (step, seconds) for each timed entrypoint invocation."""
+    deploy = shutil.which("analyst-deploy") or "analyst-deploy"
+    infer = shutil.which("analyst-infer-configs") or "analyst-infer-configs"
+    work = tempfile.mkdtemp(prefix="atd-bench-")
+    try:
+        data = os.path.join(work, "sample.csv")
+        _write_sample(data)
+        results = [
+            ("interpreter", _timed([sys.executable, "-c", "pass"], work)),
+            ("analyst-deploy --help", _timed([deploy, "--help"], work)),
+            ("analyst-deploy (scaffold)", _timed([deploy, "--target", "proj", "--dataset", data, "--ingest", "copy", "--no-generate-configs"], work)),
+            ("analyst-infer-configs", _timed([infer], os.path.join(work, "proj"))),
+        ]
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("--budget", type=float, default=None, help="Fail if any step takes longer (seconds)")
+    args = parser.parse_args()
+    results = run_benchmark()
+    slow = []
+    for step, seconds in results:
+        print(f"{step:<28} {seconds:6.3f}s")
+        if args.budget is not None and seconds > args.budget:
+            slow.append(step)
+    if slow:
+        print(f"Over the {args.budget}s budget: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,30 +7,108 @@ the end-to-end flow; helper functions are usable standalone.
 
 from __future__ import annotations
 
+import io
 import os
+import re
 import shutil
-from importlib import resources
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from rich.console import Console
 from rich.prompt import Prompt
 
-from . import infer_configs as ic
-from .utils import conda_exists, copy_file, ensure_dir, is_interactive, register_ipykernel, run, update_yaml_key
+from . import __version__, catalog
+from .bundle import open_templates
+from .checkpoints import check_compression, set_checkpoint_format
+from .remote import is_remote
+from .utils import conda_exists, ensure_dir, is_interactive, register_ipykernel, run, update_yaml_keys
 
 console = Console()
 
 
-def _pkg_path(rel: str) -> Optional[Path]:
-    """Resolve a resource path inside the installed package for data files."""
-    try:
-        base = resources.files("analyst_toolkit_deploy")
-        target = base.joinpath(rel)
-        with resources.as_file(target) as p:
-            return Path(p)
-    except Exception:
-        return None
+# Template member -> (destination, policy). "force" follows the overwrite
+# flag; "missing" only writes when the destination does not exist yet.
+_TEMPLATE_ROUTES = {
+    ".env.template": (".env", "missing"),
+    "environment.yml": ("environment.yml", "force"),
+    "requirements.txt": ("requirements.txt", "force"),
+    ".gitignore": (".gitignore", "force"),
+    "README.md": ("README.md", "force"),
+    "LICENSE": ("LICENSE", "missing"),
+    ".vscode/settings.json": (".vscode/settings.json", "force"),
+    "src/checkpoint_io.py": ("src/checkpoint_io.py", "force"),
+    "toolkit_template.ipynb": ("notebooks/toolkit_template.ipynb", "force"),
+}
+
+
+def _template_route(rel: str) -> Optional[Tuple[str, str]]:
+    """Destination and policy for a template member (None = not copied)."""
+    if rel in _TEMPLATE_ROUTES:
+        return _TEMPLATE_ROUTES[rel]
+    folder, _, name = rel.partition("/")
+    if folder == "config" and "/" not in name and name.endswith(".yaml"):
+        return rel, "force"
+    if folder == "resource_hub" and "/" not in name and name.endswith(".md"):
+        return rel, "force"
+    return None
+
+
+def _readme_lines(lines: Iterable[str], title: str) -> Iterator[str]:
+    """Stream README lines: drop the leading banner image block, fill in the title."""
+    it = iter(lines)
+    head = next(it, "")
+    if head.startswith('<p align="center">'):
+        block = [head]
+        for line in it:
+            block.append(line)
+            if "</p>" in line:
+                break
+        if not re.match(r'<p align="center">\s*<img [^>]+>', "".join(block)):
+            yield from block
+    else:
+        yield head
+    titled = False
+    for line in it:
+        if not titled and line.startswith("## (Title Placeholder)"):
+            line = line.replace("## (Title Placeholder)", f"## {title}", 1)
+            titled = True
+        yield line
+
+
+def _license_lines(lines: Iterable[str], year: str, author: str) -> Iterator[str]:
+    """Yield the LICENSE text with the copyright year (and optional author) set.
+
+    Without a copyright line one is inserted after the `MIT License` title.
+    """
+    txt = "".join(lines)
+    if re.search(r"Copyright \(c\) \d{4}", txt):
+        txt = re.sub(r"Copyright \(c\) \d{4}", f"Copyright (c) {year}", txt, count=1)
+    else:
+        txt = re.sub(r"^MIT License\n", f"MIT License\n\nCopyright (c) {year}\n", txt, count=1, flags=re.M)
+    if author:
+        txt = re.sub(r"(Copyright \(c\) \d{4})(\n)", rf"\1 {author}\2", txt, count=1)
+    yield txt
+
+
+def _with_pyarrow(lines: Iterable[str]) -> Iterator[str]:
+    """Add pyarrow next to pandas in requirements.txt / environment.yml."""
+    for line in lines:
+        yield line
+        if line.strip().lstrip("- ") == "pandas":
+            yield line.replace("pandas", "pyarrow", 1)
+
+
+def _stream_to(stream: IO[bytes], dst: Path, transform: Optional[Callable[[Iterable[str]], Iterator[str]]] = None) -> None:
+    """Write a template stream to `dst`, optionally rewriting it line by line."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if transform is None:
+        with open(dst, "wb") as out:
+            shutil.copyfileobj(stream, out)
+        return
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    with open(dst, "w", encoding="utf-8", newline="") as out:
+        out.writelines(transform(text))
 
 
 def _copy_templates(
@@ -39,8 +117,15 @@ def _copy_templates(
     project_name: str,
     vscode_ai: str,
     copy_notebook: bool,
+    pyarrow: bool = False,
 ) -> None:
-    """Copy templates into target and inject project/license details where applicable."""
+    """Stream templates into target, injecting project/license details on the way.
+
+    The template source (the packaged bundle, or the loose folder in a source
+    checkout) is opened once and each member is written straight to its
+    destination. `pyarrow` adds it to the project dependencies (Feather or
+    Parquet checkpoints, Parquet entry files).
+    """
     # Ensure dirs
     for p in [
         target_root / "src",
@@ -55,136 +140,72 @@ def _copy_templates(
     ]:
         ensure_dir(p)
 
-    # Config YAMLs
-    pkg_cfg = _pkg_path("templates/config")
-    if pkg_cfg and pkg_cfg.exists():
-        for src in pkg_cfg.glob("*.yaml"):
-            dst = target_root / "config" / src.name
-            copy_file(src, dst, overwrite=force)
-    else:
+    title = project_name or re.sub(r"[_-]+", " ", target_root.name).strip().title() or target_root.name
+    year = str(datetime.now().year)
+    # Author injection is opt-in via LICENSE_AUTHOR env var (no default)
+    author = os.environ.get("LICENSE_AUTHOR", "").strip()
+    transforms: Dict[str, Callable[[Iterable[str]], Iterator[str]]] = {
+        "README.md": lambda lines: _readme_lines(lines, title),
+        "LICENSE": lambda lines: _license_lines(lines, year, author),
+    }
+    if pyarrow:
+        transforms["requirements.txt"] = _with_pyarrow
+        transforms["environment.yml"] = _with_pyarrow
+    written: List[str] = []
+    with open_templates() as (manifest, members):
+        bundled = manifest.get("version", "")
+        if bundled and bundled != __version__:
+            raise RuntimeError(f"Packaged templates are from version {bundled} but {__version__} is installed; reinstall the package")
+        for rel, stream in members:
+            route = _template_route(rel)
+            if route is None or (rel == "toolkit_template.ipynb" and not copy_notebook):
+                continue
+            dest, policy = route
+            dst = target_root / dest
+            if dst.exists() and (policy == "missing" or not force):
+                continue
+            _stream_to(stream, dst, transforms.get(rel))
+            written.append(rel)
+
+    if not any(rel.startswith("config/") for rel in written) and not (target_root / "config" / "run_toolkit_config.yaml").exists():
         console.print("[yellow]No packaged templates found; skipping config copy[/yellow]")
 
-    # .env template
-    env_tmpl = _pkg_path("templates/.env.template")
-    if env_tmpl:
-        dst = target_root / ".env"
-        if not dst.exists():
-            copy_file(env_tmpl, dst, overwrite=True)
-
-    # environment.yml / requirements.txt / .gitignore
-    for rel in [
-        "templates/environment.yml",
-        "templates/requirements.txt",
-        "templates/.gitignore",
+    # Fallbacks when running from the original workspace bundle rather than an install
+    for rel, ws_src in [
+        ("README.md", Path.cwd() / "deploy_toolkit" / "templates" / "README.md"),
+        ("LICENSE", Path.cwd() / "LICENSE"),
+        ("toolkit_template.ipynb", Path.cwd() / "deploy_toolkit" / "templates" / "toolkit_template.ipynb"),
     ]:
-        src = _pkg_path(rel)
-        if src and src.exists():
-            copy_file(src, target_root / Path(rel).name, overwrite=force)
-
-    # README.md (prefer packaged template; fallback to workspace template)
-    readme_dst = target_root / "README.md"
-    readme_src = _pkg_path("templates/README.md")
-    if not readme_src:
-        ws_readme = Path.cwd() / "deploy_toolkit" / "templates" / "README.md"
-        if ws_readme.exists():
-            readme_src = ws_readme
-    if readme_src and readme_src.exists():
-        copy_file(readme_src, readme_dst, overwrite=force)
-        # Inject project name into README title
-        try:
-            import re
-
-            effective_name = project_name
-            if not effective_name:
-                # Derive from target folder name
-                base = target_root.name
-                effective_name = re.sub(r"[_-]+", " ", base).strip().title() or base
-            txt = readme_dst.read_text(encoding="utf-8")
-            pattern = r"^## \((?:Title Placeholder)\)"
-            if re.search(pattern, txt, flags=re.M):
-                txt = re.sub(pattern, f"## {effective_name}", txt, count=1, flags=re.M)
-            else:
-                # Fallback simple replace once
-                txt = txt.replace("## (Title Placeholder)", f"## {effective_name}", 1)
-            # Remove optional top banner image block to avoid broken links
-            txt = re.sub(
-                r"(?s)^<p align=\"center\">\s*<img [^>]+>.*?</p>\n?",
-                "",
-                txt,
-                count=1,
-            )
-            readme_dst.write_text(txt, encoding="utf-8")
-        except Exception:
-            pass
-
-    # LICENSE (prefer packaged license; fallback to workspace root LICENSE)
-    lic_dst = target_root / "LICENSE"
-    lic_src = _pkg_path("templates/LICENSE")
-    if not lic_src:
-        ws_lic = Path.cwd() / "LICENSE"
-        if ws_lic.exists():
-            lic_src = ws_lic
-    if lic_src and lic_src.exists():
-        copy_file(lic_src, lic_dst, overwrite=False)
-        # Update year; author injection is opt-in via LICENSE_AUTHOR env var (no default)
+        if rel in written or not ws_src.exists() or (rel == "toolkit_template.ipynb" and not copy_notebook):
+            continue
+        dest, policy = _TEMPLATE_ROUTES[rel]
+        if not (target_root / dest).exists() or (policy == "force" and force):
+            with open(ws_src, "rb") as stream:
+                _stream_to(stream, target_root / dest, transforms.get(rel))
+            written.append(rel)
+
+    # An existing LICENSE is kept but its year is refreshed
+    lic = target_root / "LICENSE"
+    if "LICENSE" not in written and lic.exists():
         try:
-            import re
-            from datetime import datetime
-
-            author = os.environ.get("LICENSE_AUTHOR", "").strip()
-            year = str(datetime.now().year)
-            txt = lic_dst.read_text(encoding="utf-8")
-            # Replace or insert year
-            if re.search(r"Copyright \(c\) \d{4}", txt):
-                txt = re.sub(r"Copyright \(c\) \d{4}", f"Copyright (c) {year}", txt, count=1)
-            else:
-                txt = re.sub(r"^MIT License\n", f"MIT License\n\nCopyright (c) {year}\n", txt, count=1, flags=re.M)
-            # Optionally append author after year if provided
-            if author:
-                txt = re.sub(r"(Copyright \(c\) \d{4})(\n)", rf"\1 {author}\2", txt, count=1)
-            lic_dst.write_text(txt, encoding="utf-8")
-        except Exception:
+            lic.write_text("".join(_license_lines(lic.read_text(encoding="utf-8").splitlines(True), year, author)), encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
             pass
 
-    # VS Code settings
-    vs_settings = _pkg_path("templates/.vscode/settings.json")
-    if vs_settings and vs_settings.exists():
-        dst = target_root / ".vscode" / "settings.json"
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        copy_file(vs_settings, dst, overwrite=force)
-        # Inject AI provider hint as a pseudo-key comment: omitted for simplicity; can be extended.
-
-    # Notebook template (optional)
-    if copy_notebook:
-        nb = _pkg_path("templates/toolkit_template.ipynb")
-        if nb and nb.exists():
-            copy_file(nb, target_root / "notebooks" / "toolkit_template.ipynb", overwrite=force)
-        else:
-            # Fallback: if running from the original bundle, copy notebook from workspace
-            workspace_nb = Path.cwd() / "deploy_toolkit" / "templates" / "toolkit_template.ipynb"
-            if workspace_nb.exists():
-                copy_file(workspace_nb, target_root / "notebooks" / "toolkit_template.ipynb", overwrite=force)
-            else:
-                console.print("[yellow]Notebook template not found; skipping[/yellow]")
-    else:
+    if not copy_notebook:
         console.print("[yellow]Notebook copy disabled via --copy-notebook False[/yellow]")
+    elif not (target_root / "notebooks" / "toolkit_template.ipynb").exists():
+        console.print("[yellow]Notebook template not found; skipping[/yellow]")
 
-    # Resource hub documentation (prefer packaged; fallback to workspace tool_kit_resources)
+    # Create a landing page if we have >=3 docs and no README in resource_hub
     docs_dst = target_root / "resource_hub"
     docs_dst.mkdir(parents=True, exist_ok=True)
-    docs_src = _pkg_path("templates/resource_hub")
-    copied = []
-    # Copy packaged docs exactly (authoritative templates)
-    if docs_src and docs_src.exists():
-        for md in sorted(docs_src.glob("*.md")):
-            copy_file(md, docs_dst / md.name, overwrite=force)
-            copied.append(md.name)
-    # Create a landing page if we have >=3 docs and no README in resource_hub
+    copied = sorted(p.name for p in docs_dst.glob("*.md") if p.name != "README.md")
     if len(copied) >= 3:
         hub_readme = docs_dst / "README.md"
         if not hub_readme.exists():
             try:
-                links = "\n".join(f"- {name}" for name in sorted(copied))
+                links = "\n".join(f"- {name}" for name in copied)
                 hub_readme.write_text(("Resource Hub\n\n" + "Curated documentation for the scaffolded project.\n\n" + links + "\n"), encoding="utf-8")
             except Exception:
                 pass
@@ -196,8 +217,17 @@ def _wire_dataset(
     target_root: Path,
     dataset: str,
     ingest: str = "copy",
+    catalog_dirs: Optional[List[Path]] = None,
 ) -> Optional[Path]:
-    """Select a CSV and write its path to the run config, with optional ingest."""
+    """Select a CSV and write its path to the run config, with optional ingest.
+
+    Candidates come from the project dataset catalog (`data/catalog.sqlite`),
+    refreshed incrementally over `data/raw/`, the project root and any extra
+    `catalog_dirs`. `dataset` may be `auto`, `prompt`, a path, a catalog
+    query (`name:<glob>`, a bare glob, or `schema:<col1,col2>`), or a
+    remote URL (`s3://`, `gs://`, `http(s)://`, `file://`) wired as-is.
+    """
+    target_root = target_root.resolve()
     cfg = target_root / "config" / "run_toolkit_config.yaml"
     chosen: Optional[Path] = None
 
@@ -208,20 +238,14 @@ def _wire_dataset(
             entry = str(rel)
         except Exception:
             entry = str(path)
-        update_yaml_key(cfg, "pipeline_entry_path", entry)
-        # Suggest run_id if missing
-        try:
-            import yaml  # local import
-
-            data = yaml.safe_load(cfg.read_text()) or {}
-            if not data.get("run_id"):
-                stem = path.stem
-                from time import strftime
+        # Single read-modify-write; run_id is only suggested when missing
+        from time import strftime
 
-                data["run_id"] = f"{stem}_{strftime('%Y%m%d_%H%M%S')}"
-                cfg.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
-        except Exception:
-            pass
+        update_yaml_keys(
+            cfg,
+            {"pipeline_entry_path": entry},
+            defaults={"run_id": f"{path.stem}_{strftime('%Y%m%d_%H%M%S')}"},
+        )
 
     def ingest_if_needed(src: Path) -> Path:
         """Move/copy CSV into data/raw unless already under that folder."""
@@ -238,18 +262,41 @@ def _wire_dataset(
         else:
             return src
 
+    if is_remote(dataset):
+        # Remote sources are read in place (range requests), never ingested
+        from time import strftime
+
+        stem = Path(dataset.split("?", 1)[0]).stem or "dataset"
+        update_yaml_keys(cfg, {"pipeline_entry_path": dataset}, defaults={"run_id": f"{stem}_{strftime('%Y%m%d_%H%M%S')}"})
+        console.print(f"[green]Wired remote dataset:[/green] {dataset}")
+        return None
+
+    raw_dir = target_root / "data" / "raw"
+    search_dirs = [raw_dir, target_root] + [Path(d) for d in (catalog_dirs or [])]
+    entries = catalog.refresh_catalog(target_root, search_dirs=search_dirs)
+
     if dataset == "auto":
-        raw = sorted((target_root / "data" / "raw").glob("*.csv"))
-        root_csv = sorted(target_root.glob("*.csv"))
+        raw = [e["path"] for e in entries if e["path"].parent == raw_dir]
+        root_csv = [e["path"] for e in entries if e["path"].parent == target_root]
         if len(raw) == 1:
             chosen = raw[0]
         elif len(root_csv) == 1:
             chosen = ingest_if_needed(root_csv[0])
         else:
-            console.print("[yellow]Multiple or no CSVs found; skipping dataset wiring[/yellow]")
+            console.print("[yellow]Multiple or no CSVs found; skipping dataset wiring (select with --dataset name:<glob> or schema:<cols>)[/yellow]")
             return None
+    elif catalog.is_catalog_query(dataset):
+        matches = catalog.select_datasets(entries, dataset)
+        if not matches:
+            console.print(f"[yellow]No catalogued dataset matches: {dataset}[/yellow]")
+            return None
+        if len(matches) > 1:
+            console.print(f"[yellow]{len(matches)} datasets match {dataset}; using the most recent[/yellow]")
+        chosen = matches[0]["path"]
+        if chosen.parent != raw_dir and ingest != "none":
+            chosen = ingest_if_needed(chosen)
     elif dataset == "prompt":
-        opts = sorted((target_root / "data" / "raw").glob("*.csv")) + sorted(target_root.glob("*.csv"))
+        opts = [e["path"] for e in entries if e["path"].parent == raw_dir] + [e["path"] for e in entries if e["path"].parent != raw_dir]
         if not opts:
             console.print("[yellow]No CSVs found to select[/yellow]")
             return None
@@ -302,6 +349,9 @@ def _persist_env_defaults(
     kernel_name: str,
     project_name: str,
     vscode_ai: str,
+    checkpoint_format: str = "",
+    checkpoint_compression: str = "",
+    checkpoint_level: Optional[int] = None,
 ) -> None:
     envf = target_root / ".env"
     envf.touch(exist_ok=True)
@@ -325,6 +375,9 @@ def _persist_env_defaults(
     upsert("KERNEL_NAME", kernel_name)
     upsert("PROJECT_NAME", project_name)
     upsert("VSCODE_AI", vscode_ai)
+    upsert("CHECKPOINT_FORMAT", checkpoint_format)
+    upsert("CHECKPOINT_COMPRESSION", checkpoint_compression)
+    upsert("CHECKPOINT_COMPRESSION_LEVEL", "" if checkpoint_level is None else str(checkpoint_level))
     envf.write_text(text, encoding="utf-8")
 
 
@@ -439,8 +492,13 @@ def bootstrap(
     kernel_name: Optional[str] = None,
     dataset: str = "auto",
     ingest: str = "copy",
+    catalog_dirs: Optional[List[Path]] = None,
     copy_notebook: bool = True,
     generate_configs: bool = False,
+    to_parquet: bool = False,
+    checkpoint_format: str = "joblib",
+    checkpoint_compression: str = "",
+    checkpoint_level: Optional[int] = None,
     project_name: str = "",
     vscode_ai: str = "gemini",
     reuse_env: bool = True,
@@ -452,13 +510,13 @@ def bootstrap(
     kernel_name = kernel_name or f"Python ({name})"
 
     console.print("[bold]Scaffolding folders and templates[/bold]")
-    _copy_templates(target, force_copy, project_name, vscode_ai, copy_notebook)
+    _copy_templates(target, force_copy, project_name, vscode_ai, copy_notebook, pyarrow=to_parquet or checkpoint_format in ("feather", "parquet"))
 
     console.print("[bold]Wiring dataset (if available)[/bold]")
-    chosen = _wire_dataset(target, dataset=dataset, ingest=ingest)
+    chosen = _wire_dataset(target, dataset=dataset, ingest=ingest, catalog_dirs=catalog_dirs)
 
     console.print("[bold]Persisting .env defaults[/bold]")
-    _persist_env_defaults(target, name, kernel_name, project_name, vscode_ai)
+    _persist_env_defaults(target, name, kernel_name, project_name, vscode_ai, checkpoint_format, checkpoint_compression, checkpoint_level)
 
     # Validate choice-like inputs to keep behavior strict but Typer-compatible
     valid_env = {"conda", "venv", "none"}
@@ -473,6 +531,11 @@ def bootstrap(
     if vscode_ai not in valid_ai:
         console.print(f"[red]Invalid vscode_ai: {vscode_ai}. Use one of: {sorted(valid_ai)}[/red]")
         return
+    try:
+        check_compression(checkpoint_format, checkpoint_compression)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return
 
     if env == "conda":
         console.print("[bold]Setting up Conda environment[/bold]")
@@ -492,11 +555,33 @@ def bootstrap(
     if generate_configs:
         console.print("[bold]Generating suggested configs[/bold]")
         try:
-            outdir = ic.infer_configs(str(target), input_path=str(chosen) if chosen else None)
+            from . import infer_configs as ic
+
+            outdir = ic.infer_configs(str(target), input_path=str(chosen) if chosen else None)["outdir"]
             console.print(f"[green]Generated configs:[/green] {Path(outdir).relative_to(target)}")
         except Exception as e:
             console.print(f"[yellow]Skipping config generation:[/yellow] {e}")
 
+    if to_parquet:
+        console.print("[bold]Converting dataset to typed Parquet[/bold]")
+        if not chosen:
+            console.print("[yellow]No wired dataset; skipping Parquet conversion[/yellow]")
+        else:
+            try:
+                from .convert import convert_dataset
+
+                rel = convert_dataset(str(target), str(chosen))
+                console.print(f"[green]Pipeline now reads:[/green] {rel}")
+            except Exception as e:
+                console.print(f"[yellow]Skipping Parquet conversion:[/yellow] {e}")
+
+    if checkpoint_format != "joblib":
+        set_checkpoint_format(target, checkpoint_format)
+        console.print(
+            f"[green]Helper checkpoints set to {checkpoint_format}:[/green] modules keep joblib; "
+            f"src/checkpoint_io.export_checkpoint mirrors them under exports/{checkpoint_format}/"
+        )
+
     if run_smoke:
         cfg = target / "config" / "run_toolkit_config.yaml"
         console.print("[bold]Smoke test command:[/bold]")
@@ -0,0 +1,69 @@
+"""Read-once access to the packaged project templates.
+
+Built wheels ship the templates as a single versioned archive,
+`analyst_toolkit_deploy/templates.zip` (made by `hatch_build.py`, with a
+`bundle.json` manifest). Scaffolding opens it once and streams each member
+straight to its destination, so it works from zipped installs, zipapps and
+PEX files without extracting anything to temporary paths. Source checkouts
+and editable installs have no archive and read the `templates/` folder
+through `importlib.resources` instead.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from contextlib import contextmanager
+from importlib import resources
+from typing import IO, Any, Dict, Iterator, Tuple
+
+PACKAGE = "analyst_toolkit_deploy"
+BUNDLE_NAME = "templates.zip"
+MANIFEST_NAME = "bundle.json"
+
+
+def _walk(node: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield (relative posix path, Traversable) for files under `node`."""
+    for child in sorted(node.iterdir(), key=lambda c: c.name):
+        if child.name == "__pycache__":
+            continue
+        rel = f"{prefix}{child.name}"
+        if child.is_dir():
+            yield from _walk(child, rel + "/")
+        else:
+            yield rel, child
+
+
+@contextmanager
+def open_templates() -> Iterator[Tuple[Dict[str, Any], Iterator[Tuple[str, IO[bytes]]]]]:
+    """Open the template source once; yield (manifest, member iterator).
+
+    The iterator yields (relative path, binary stream) pairs, e.g.
+    `("config/diag_config.yaml", <stream>)`; each stream is only valid
+    until the next member is requested. The manifest holds `version` and
+    `files` (empty `version` when reading the loose folder).
+    """
+    base = resources.files(PACKAGE)
+    archive = base.joinpath(BUNDLE_NAME)
+    if archive.is_file():
+        with archive.open("rb") as raw, zipfile.ZipFile(raw) as zf:
+            manifest = json.loads(zf.read(MANIFEST_NAME)) if MANIFEST_NAME in zf.namelist() else {"version": "", "files": []}
+
+            def members() -> Iterator[Tuple[str, IO[bytes]]]:
+                for info in zf.infolist():
+                    if info.is_dir() or info.filename == MANIFEST_NAME:
+                        continue
+                    with zf.open(info) as stream:
+                        yield info.filename, stream
+
+            yield manifest, members()
+        return
+    folder = base.joinpath("templates")
+    files = list(_walk(folder)) if folder.is_dir() else []
+
+    def loose() -> Iterator[Tuple[str, IO[bytes]]]:
+        for rel, node in files:
+            with node.open("rb") as stream:
+                yield rel, stream
+
+    yield {"version": "", "files": [rel for rel, _ in files]}, loose()
@@ -0,0 +1,182 @@
+"""SQLite-backed catalog of candidate datasets for a scaffolded project.
+
+Indexes CSV files (size, mtime, row count, header hash and column list)
+into `data/catalog.sqlite` so dataset wiring can select by name, glob
+pattern or schema without rescanning every file. Refreshes are
+incremental: only files whose size or mtime changed are re-read.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+CATALOG_REL = Path("data") / "catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    rows INTEGER,
+    header_hash TEXT,
+    columns TEXT,
+    indexed_at REAL
+);
+CREATE INDEX IF NOT EXISTS datasets_name ON datasets (name);
+CREATE INDEX IF NOT EXISTS datasets_header_hash ON datasets (header_hash);
+"""
+
+
+def catalog_path(root: Path) -> Path:
+    """Return the catalog database path for a project root."""
+    return root / CATALOG_REL
+
+
+def _connect(root: Path) -> sqlite3.Connection:
+    """Open (and initialise if needed) the project catalog."""
+    db = catalog_path(root)
+    db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def read_header(path: Path) -> bytes:
+    """Return the raw first line of a file (without the line terminator)."""
+    with open(path, "rb") as f:
+        return f.readline().rstrip(b"\r\n")
+
+
+def header_hash(header: bytes) -> str:
+    """Stable hash of a CSV header line, used for schema matching.
+
+    A leading UTF-8 BOM is ignored, so exports with and without one match.
+    """
+    return hashlib.sha1(header.strip().removeprefix(codecs.BOM_UTF8).strip()).hexdigest()
+
+
+def count_rows(path: Path, chunk_size: int = 1 << 20) -> int:
+    """Count data rows by scanning for newlines in binary chunks.
+
+    Line-based: quoted fields that embed newlines are over-counted. The
+    header line is excluded and a missing trailing newline is tolerated.
+    """
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(chunk_size)
+            if not buf:
+                break
+            lines += buf.count(b"\n")
+            last = buf[-1:]
+    if last and last != b"\n":
+        lines += 1
+    return max(lines - 1, 0)
+
+
+def _index_file(path: Path, st: os.stat_result) -> Dict[str, Any]:
+    """Read header and row count for one file into a catalog record."""
+    header = read_header(path)
+    try:
+        cols = next(csv.reader(io.StringIO(header.decode("utf-8-sig", errors="replace"))), [])
+    except csv.Error:
+        cols = []
+    return {
+        "path": str(path),
+        "name": path.name,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "rows": count_rows(path),
+        "header_hash": header_hash(header),
+        "columns": json.dumps(cols),
+        "indexed_at": time.time(),
+    }
+
+
+def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+    entry = dict(row)
+    entry["path"] = Path(entry["path"])
+    entry["columns"] = json.loads(entry["columns"] or "[]")
+    return entry
+
+
+def refresh_catalog(
+    root: Path,
+    search_dirs: Optional[Iterable[Path]] = None,
+    pattern: str = "*.csv",
+) -> List[Dict[str, Any]]:
+    """Incrementally index CSVs under `search_dirs` and return their entries.
+
+    Defaults to `data/raw/` and the project root (non-recursive). Files whose
+    size and mtime are unchanged keep their existing record; vanished files
+    are dropped from the catalog. Only files found by this scan are
+    returned: records for other folders stay in the catalog but are not
+    offered, since they may point at files that no longer exist.
+    """
+    root = root.resolve()
+    dirs = [root / "data" / "raw", root] if search_dirs is None else [Path(d).resolve() for d in search_dirs]
+    conn = _connect(root)
+    try:
+        known = {r["path"]: (r["size"], r["mtime_ns"]) for r in conn.execute("SELECT path, size, mtime_ns FROM datasets")}
+        seen = set()
+        for d in dirs:
+            if not d.is_dir():
+                continue
+            with os.scandir(d) as it:
+                for de in it:
+                    if not de.is_file() or not fnmatch.fnmatch(de.name, pattern):
+                        continue
+                    p = str(Path(de.path).resolve())
+                    seen.add(p)
+                    st = de.stat()
+                    if known.get(p) == (st.st_size, st.st_mtime_ns):
+                        continue
+                    rec = _index_file(Path(p), st)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO datasets (path, name, size, mtime_ns, rows, header_hash, columns, indexed_at) "
+                        "VALUES (:path, :name, :size, :mtime_ns, :rows, :header_hash, :columns, :indexed_at)",
+                        rec,
+                    )
+        scanned = {str(d) for d in dirs}
+        stale = [p for p in known if p not in seen and str(Path(p).parent) in scanned]
+        conn.executemany("DELETE FROM datasets WHERE path = ?", [(p,) for p in stale])
+        conn.commit()
+        return [_row_to_entry(r) for r in conn.execute("SELECT * FROM datasets ORDER BY path") if r["path"] in seen]
+    finally:
+        conn.close()
+
+
+def is_catalog_query(dataset: str) -> bool:
+    """True if a `--dataset` value is a catalog query rather than a path."""
+    return dataset.startswith(("name:", "schema:")) or any(ch in dataset for ch in "*?[")
+
+
+def select_datasets(entries: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    """Filter catalog entries by a query, newest first.
+
+    Supported forms:
+    - `name:<glob>` or a bare glob such as `orders_*.csv` – match file names
+      (the `.csv` suffix is optional in the pattern).
+    - `schema:<col1,col2,...>` – datasets whose header contains all columns.
+    """
+    if query.startswith("schema:"):
+        wanted = [c.strip() for c in query[len("schema:") :].split(",") if c.strip()]
+        matches = [e for e in entries if wanted and set(wanted).issubset(e["columns"])]
+    else:
+        pat = query[len("name:") :] if query.startswith("name:") else query
+        pat = os.path.basename(pat)
+        matches = [e for e in entries if fnmatch.fnmatch(e["name"], pat) or fnmatch.fnmatch(Path(e["name"]).stem, pat)]
+    return sorted(matches, key=lambda e: e["mtime_ns"], reverse=True)
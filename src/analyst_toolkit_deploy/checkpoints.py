@@ -0,0 +1,47 @@
+"""Checkpoint storage format selection for scaffolded projects.
+
+The toolkit hands DataFrames between modules as
+`exports/joblib/{run_id}/..._*.joblib` pickles and always writes joblib,
+so module configs keep those paths. The chosen format (saved in the
+project `.env`) applies to the scaffolded `src/checkpoint_io.py` helper:
+`export_checkpoint` mirrors a toolkit checkpoint to
+`exports/<format>/...` (Feather/Arrow IPC or Parquet) and
+`load_checkpoint` reads the mirror when it is current. Feather and
+Parquet need pyarrow, which scaffolding adds to the project requirements
+only when one of them is chosen.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .utils import ensure_dir
+
+CHECKPOINT_FORMATS = ("joblib", "feather", "parquet")
+
+# Codecs each format's writer accepts ("none" = uncompressed)
+CHECKPOINT_CODECS = {
+    "joblib": ("zlib", "gzip", "bz2", "lzma", "xz", "lz4", "none"),
+    "feather": ("lz4", "zstd", "none"),
+    "parquet": ("snappy", "gzip", "brotli", "lz4", "zstd", "none"),
+}
+
+
+def check_compression(fmt: str, codec: str) -> None:
+    """Raise ValueError unless `codec` (empty = format default) suits `fmt`."""
+    if fmt not in CHECKPOINT_FORMATS:
+        raise ValueError(f"Invalid checkpoint format: {fmt}. Use one of: {list(CHECKPOINT_FORMATS)}")
+    if codec and codec not in CHECKPOINT_CODECS[fmt]:
+        raise ValueError(f"Invalid checkpoint compression for {fmt}: {codec}. Use one of: {list(CHECKPOINT_CODECS[fmt])}")
+
+
+def set_checkpoint_format(root: Path, fmt: str) -> Path:
+    """Create `exports/<fmt>/` for helper-written checkpoints and return it.
+
+    Module configs are left alone: they keep the joblib paths the toolkit
+    writes. Raises ValueError for an unknown format.
+    """
+    if fmt not in CHECKPOINT_FORMATS:
+        raise ValueError(f"Invalid checkpoint format: {fmt}. Use one of: {list(CHECKPOINT_FORMATS)}")
+    ensure_dir(root / "exports" / fmt)
+    return root / "exports" / fmt
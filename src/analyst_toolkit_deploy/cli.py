@@ -1,8 +1,10 @@
 """Typer-powered CLI entrypoints.
 
-Exposes two commands:
+Exposes four commands:
 - `deploy` – scaffold a project and optionally set up an env/kernel.
 - `infer-configs` – scan a CSV and generate suggested YAML configs.
+- `plan` – dry-run resource estimate for the enabled pipeline modules.
+- `serve` – local profiling service with a warm worker pool.
 
 The functions below are thin wrappers around the underlying library
 functions to keep command parsing and business logic cleanly separated.
@@ -11,13 +13,11 @@ functions to keep command parsing and business logic cleanly separated.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 import typer
 from rich import print
-
-from . import infer_configs as ic
-from .bootstrap import bootstrap
+from typer.core import TyperGroup
 
 app = typer.Typer(
     add_completion=False,
@@ -49,12 +49,16 @@ def deploy_cmd(
     ),
     dataset: str = typer.Option(
         "auto",
-        help="Dataset wiring: auto|prompt|<path>",
+        help="Dataset wiring: auto|prompt|<path>|<url>|name:<glob>|schema:<col1,col2>",
     ),
     ingest: str = typer.Option(
         "copy",
         help="Ingest policy for root CSV: move|copy|none",
     ),
+    catalog_dirs: str = typer.Option(
+        "",
+        help="Extra folders to index in the dataset catalog (comma-separated)",
+    ),
     copy_notebook: bool = typer.Option(
         True,
         help="Copy the starter notebook if bundled",
@@ -63,6 +67,22 @@ def deploy_cmd(
         False,
         help="Generate inferred config YAMLs",
     ),
+    to_parquet: bool = typer.Option(
+        False,
+        help="Convert the wired CSV to typed Parquet under data/processed and rewire configs (needs pyarrow)",
+    ),
+    checkpoint_format: str = typer.Option(
+        "joblib",
+        help="Format for src/checkpoint_io helper checkpoints: joblib|feather|parquet (modules keep joblib; feather/parquet need pyarrow)",
+    ),
+    checkpoint_compression: str = typer.Option(
+        "",
+        help="Checkpoint codec: feather lz4|zstd|none, parquet snappy|gzip|brotli|lz4|zstd|none, joblib zlib|gzip|bz2|lzma|xz|lz4|none",
+    ),
+    checkpoint_level: Optional[int] = typer.Option(
+        None,
+        help="Checkpoint compression level",
+    ),
     project_name: str = typer.Option(
         "",
         help="Project name for README / notebook injection",
@@ -93,10 +113,14 @@ def deploy_cmd(
     Parameters are grouped as follows:
     - Target and naming: `target`, `name`, `kernel_name`, `project_name`.
     - Environment controls: `env`, `reuse_env`, `force_recreate`.
-    - Dataset wiring: `dataset`, `ingest`.
+    - Dataset wiring: `dataset`, `ingest`, `catalog_dirs`.
     - Templates and docs: `copy_notebook`, `force_copy`, `vscode_ai`.
-    - Extras: `generate_configs`, `run_smoke`.
+    - Checkpoints: `checkpoint_format`, `checkpoint_compression`, `checkpoint_level`.
+    - Extras: `generate_configs`, `to_parquet`, `run_smoke`.
     """
+    # Heavy modules (pandas) load on demand so `--help` and plain scaffolding start fast
+    from .bootstrap import bootstrap
+
     bootstrap(
         target=target,
         env=env,  # explicit opt-in only
@@ -104,8 +128,13 @@ def deploy_cmd(
         kernel_name=kernel_name,
         dataset=dataset,
         ingest=ingest,
+        catalog_dirs=[Path(d.strip()) for d in catalog_dirs.split(",") if d.strip()],
         copy_notebook=copy_notebook,
         generate_configs=generate_configs,
+        to_parquet=to_parquet,
+        checkpoint_format=checkpoint_format,
+        checkpoint_compression=checkpoint_compression,
+        checkpoint_level=checkpoint_level,
         project_name=project_name,
         vscode_ai=vscode_ai,
         reuse_env=reuse_env,
@@ -117,44 +146,221 @@ def deploy_cmd(
 
 @app.command("infer-configs")
 def infer_configs_cmd(
-    input: Optional[Path] = typer.Option(None, help="Path to input CSV; defaults to config or single CSV under data/raw"),
+    input: Optional[str] = typer.Option(None, help="Input CSV, directory, glob of partitions or s3/gs/http(s)/file URL; defaults to config or data/raw"),
     outdir: Optional[Path] = typer.Option(None, help="Output directory for generated YAMLs; defaults to config/generated"),
     sample_rows: Optional[int] = typer.Option(None, help="Sample first N rows for speed"),
+    chunksize: Optional[int] = typer.Option(None, help="Stream the CSV in chunks of N rows to bound memory"),
+    max_workers: Optional[int] = typer.Option(None, help="Worker processes for multi-partition inputs (default: CPU count)"),
     max_unique: int = typer.Option(30, help="Max unique values to consider a column categorical"),
     exclude_patterns: str = typer.Option("id|uuid|tag", help="Regex for columns to exclude from categorical/outlier inference"),
     detect_datetimes: bool = typer.Option(True, help="Attempt to infer datetimes from object columns"),
     datetime_hints: Optional[str] = typer.Option(None, help="Comma-separated hints: col:strftime e.g. capture_date:%Y-%m-%d"),
+    to_parquet: bool = typer.Option(False, help="Also convert the input to typed Parquet under data/processed and rewire configs (needs pyarrow)"),
+    check: bool = typer.Option(False, "--check", help="Only check the CSV for drift against existing generated configs; exit 1 on drift"),
+    watch: bool = typer.Option(False, "--watch", help="Keep running and regenerate configs when files in data/raw (or --input) change"),
+    settle: float = typer.Option(2.0, help="Watch mode: seconds a file's size must stay unchanged before it is processed"),
+    float32: bool = typer.Option(False, "--float32", help="Let the dtype plan downcast floats with <= 6 significant digits to float32 (changes stored values)"),
 ):
     """Inspect a CSV and write suggested config YAMLs under `config/`.
 
     If `--input` is not supplied, we try to infer the project CSV from
     `config/run_toolkit_config.yaml` or a single CSV under `data/raw/`.
+    With `--check`, nothing is written: a header + sample read is compared
+    against the existing autofill configs and drift sets a nonzero exit code.
+    With `--watch`, the process stays up and regenerates configs as new
+    extracts land.
     """
+    from . import infer_configs as ic
+
     root = Path.cwd()
     hints = [s.strip() for s in (datetime_hints or "").split(",") if s.strip()]
-    out = ic.infer_configs(
+    if check:
+        try:
+            drift = ic.check_configs(
+                root=str(root),
+                input_path=input,
+                outdir=str(outdir) if outdir else None,
+                sample_rows=sample_rows if sample_rows is not None else 10000,
+                max_unique=max_unique,
+                exclude_patterns=exclude_patterns,
+                detect_datetimes=detect_datetimes,
+                datetime_hints=hints,
+            )
+        except RuntimeError as e:
+            print(f"[red]{e}[/red]")
+            raise typer.Exit(code=2)
+        if drift:
+            print(f"[red]Schema drift detected ({len(drift)}):[/red]")
+            for msg in drift:
+                print(f"  - {msg}")
+            raise typer.Exit(code=1)
+        print("[green]No drift: extract matches generated configs[/green]")
+        return
+    if watch:
+        from .watch import watch as watch_inputs
+
+        try:
+            watch_inputs(
+                str(root),
+                input_path=input,
+                outdir=str(outdir) if outdir else None,
+                settle=settle,
+                exclude_patterns=exclude_patterns,
+                datetime_hints=hints,
+                max_workers=max_workers,
+                sample_rows=sample_rows,
+                max_unique=max_unique,
+                detect_datetimes=detect_datetimes,
+                chunksize=chunksize,
+                float32=float32,
+            )
+        except RuntimeError as e:
+            print(f"[red]{e}[/red]")
+            raise typer.Exit(code=2)
+        except KeyboardInterrupt:
+            print("[green]Stopped watching[/green]")
+        return
+    result = ic.infer_configs(
         root=str(root),
-        input_path=str(input) if input else None,
+        input_path=input,
         outdir=str(outdir) if outdir else None,
         sample_rows=sample_rows,
         max_unique=max_unique,
         exclude_patterns=exclude_patterns,
         detect_datetimes=detect_datetimes,
         datetime_hints=hints,
+        chunksize=chunksize,
+        max_workers=max_workers,
+        float32=float32,
     )
     # Display a friendly relative path when possible without raising
-    disp = Path(out)
+    disp = Path(result["outdir"])
     try:
         disp = disp.resolve().relative_to(root.resolve())
     except Exception:
         # If resolution/relativization fails, fall back to raw path
         pass
     print(f"[green]Wrote suggested YAMLs to:[/green] {disp}")
+    if result["partitions"] > 1:
+        print(f"[green]Merged {result['partitions']} partitions[/green]; {len(result['deviations'])} with deviations (see partitions_report.yaml)")
+    mb = 1024 * 1024
+    print(f"[green]Dtype plan:[/green] {result['bytes_before'] / mb:.1f} MB -> {result['bytes_after'] / mb:.1f} MB in memory (see dtype_plan_autofill.yaml)")
+    miss = result["missingness"]
+    with_nulls = sum(1 for r in miss["null_rates"].values() if r)
+    complete = miss["complete_rows"] / miss["rows"] if miss["rows"] else 1.0
+    print(f"[green]Missingness:[/green] {with_nulls} of {len(miss['null_rates'])} columns have nulls; {complete:.1%} of rows complete (profile.json)")
+    coercions = result["coercions"]
+    if coercions:
+        sentinels = sum(1 for info in coercions.values() if info["sentinels"])
+        print(
+            f"[green]Coercions:[/green] {len(coercions)} text columns hold numbers/booleans, {sentinels} with sentinels " "(normalization_config_autofill.yaml)"
+        )
+    if to_parquet:
+        from .convert import convert_dataset
+
+        input_csv = input or ic._find_entry_csv(str(root))
+        try:
+            rel = convert_dataset(str(root), input_csv, chunksize=chunksize or 500_000, datetime_hints=hints, max_unique=max_unique)
+        except RuntimeError as e:
+            print(f"[red]{e}[/red]")
+            raise typer.Exit(code=1)
+        print(f"[green]Converted to Parquet; pipeline now reads:[/green] {rel}")
+
+
+@app.command("plan")
+def plan_cmd(
+    target: Path = typer.Option(Path("."), file_okay=False, dir_okay=True, help="Project root to plan"),
+    input: Optional[str] = typer.Option(None, help="Input to plan for; defaults to pipeline_entry_path"),
+    sample_rows: int = typer.Option(50_000, help="Rows sampled for the dtype plan and timing calibration"),
+    as_json: bool = typer.Option(False, "--json", help="Print the plan as JSON"),
+):
+    """Estimate memory, checkpoint sizes and runtime of the enabled modules.
+
+    Nothing is run: a sampled profile of `pipeline_entry_path` feeds simple
+    per-module cost models. Risky settings are flagged and set exit code 1.
+    """
+    import json
+
+    from .planner import plan_pipeline
+
+    try:
+        report = plan_pipeline(str(target), input_path=input, sample_rows=sample_rows)
+    except RuntimeError as e:
+        print(f"[red]{e}[/red]")
+        raise typer.Exit(code=2)
+    flags = report["flags"] + [f for m in report["modules"] for f in m["flags"]]
+    if as_json:
+        typer.echo(json.dumps(report, indent=2))
+        if flags:
+            raise typer.Exit(code=1)
+        return
+    mb = 1024 * 1024
+    print(
+        f"[green]Input:[/green] {report['rows']:,} rows x {report['columns']} cols; "
+        f"{report['frame_bytes'] / mb:.1f} MB in memory ({report['frame_bytes_planned'] / mb:.1f} MB with read_options); "
+        f"load ~{report['load_seconds']:.1f}s"
+    )
+    for m in report["modules"]:
+        print(f"  {m['module']:<22} peak {m['peak_bytes'] / mb:>9.1f} MB  checkpoint {m['checkpoint_bytes'] / mb:>8.1f} MB  ~{m['seconds']:.1f}s")
+    print(
+        f"[green]Estimated peak:[/green] {report['peak_bytes'] / mb:.1f} MB; "
+        f"checkpoints {report['checkpoint_bytes'] / mb:.1f} MB; runtime ~{report['seconds']:.1f}s"
+    )
+    if flags:
+        print(f"[yellow]Risky settings ({len(flags)}):[/yellow]")
+        for msg in flags:
+            print(f"  - {msg}")
+        raise typer.Exit(code=1)
+
+
+@app.command("serve")
+def serve_cmd(
+    host: str = typer.Option("127.0.0.1", help="Interface to bind (keep on localhost)"),
+    port: int = typer.Option(8765, help="TCP port"),
+    socket: Optional[Path] = typer.Option(None, help="Serve on this Unix socket instead of TCP"),
+    workers: Optional[int] = typer.Option(None, help="Pre-warmed worker processes (default: CPU count)"),
+    cache_size: int = typer.Option(256, help="Profiles kept in the shared cache"),
+    max_concurrent: int = typer.Option(32, help="Requests processed at once; others wait, then get 503"),
+    root: Path = typer.Option(
+        Path("."), file_okay=False, dir_okay=True, help="Only folder the endpoints may read or write (local paths must resolve inside it)"
+    ),
+):
+    """Run the local profiling service (profile/infer/check JSON endpoints)."""
+    from .service import serve
+
+    try:
+        serve(
+            host=host,
+            port=port,
+            socket_path=str(socket) if socket else None,
+            workers=workers,
+            cache_size=cache_size,
+            max_concurrent=max_concurrent,
+            root=str(root),
+        )
+    except KeyboardInterrupt:
+        print("[green]Profiling service stopped[/green]")
+
+
+class _DeployGroup(TyperGroup):
+    """Command group that runs `deploy` unless a subcommand is named first."""
+
+    def parse_args(self, ctx: Any, args: List[str]) -> List[str]:
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = ["deploy", *args]
+        return super().parse_args(ctx, args)
+
+
+# `analyst-deploy [options]` scaffolds a project; `plan` and `serve` are real subcommands
+deploy_app = typer.Typer(cls=_DeployGroup, add_completion=False, help="Scaffold an Analyst Toolkit project (default command), or plan/serve one")
+deploy_app.command("deploy")(deploy_cmd)
+deploy_app.command("plan")(plan_cmd)
+deploy_app.command("serve")(serve_cmd)
 
 
 def main_deploy() -> None:
-    # Single-command entrypoint: expose just the deploy command
-    typer.run(deploy_cmd)
+    # Entrypoint: `deploy` by default, plus the `plan` and `serve` subcommands
+    deploy_app()
 
 
 def main_infer() -> None:
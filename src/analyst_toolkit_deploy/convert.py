@@ -0,0 +1,178 @@
+"""Typed columnar conversion of the wired CSV into partitioned Parquet.
+
+Streams the entry CSV in chunks, applies the inferred dtypes (datetimes
+parsed, low-cardinality strings dictionary-encoded) and writes one Parquet
+part file per chunk under `data/processed/<stem>/`. Module configs are then
+rewired so every pipeline stage reads the typed copy instead of re-parsing
+the CSV. Requires the optional `pyarrow` dependency.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import reduce
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .utils import replace_yaml_scalars, update_yaml_keys, yaml_load
+
+# Keys that carry a module's entry dataset in the scaffolded configs.
+_INPUT_KEYS = ["input_path", "raw_data_path"]
+
+
+def _require_pyarrow() -> Any:
+    """Import pyarrow or raise a RuntimeError with install instructions."""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("Parquet conversion requires pyarrow: pip install 'analyst_toolkit_deploy[parquet]'") from e
+    return pyarrow
+
+
+def arrow_schema(columns: List[str], types: Dict[str, str], categoricals: Iterable[str] = ()) -> Any:
+    """Map inferred dtype labels to an Arrow schema.
+
+    Object columns listed in `categoricals` become dictionary-encoded
+    strings; other object columns are plain strings. Arrow integers are
+    nullable, so NaNs in later chunks do not force a float column.
+    """
+    pa = _require_pyarrow()
+    cats = set(categoricals)
+    mapping = {
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "datetime64[ns]": pa.timestamp("ns"),
+    }
+    fields = []
+    for col in columns:
+        t = types.get(col, "object")
+        if t in mapping:
+            fields.append(pa.field(col, mapping[t]))
+        elif col in cats:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+def convert_to_parquet(
+    input_csvs: List[str],
+    out_dir: str,
+    types: Dict[str, str],
+    categoricals: Iterable[str] = (),
+    datetime_formats: Optional[Dict[str, str]] = None,
+    chunksize: int = 500_000,
+) -> List[str]:
+    """Stream one or more CSVs into typed Parquet part files under `out_dir`.
+
+    Each chunk of each input becomes one `part-NNNNN.parquet`; existing
+    part files in `out_dir` are replaced. Raises RuntimeError if a chunk
+    does not fit the inferred types (e.g. types inferred from a sample that
+    missed fractional values). Returns the written part paths.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    header = list(pd.read_csv(input_csvs[0], nrows=0).columns)
+    schema = arrow_schema(header, types, categoricals)
+    text_cols = {f.name for f in schema if pa.types.is_string(f.type) or pa.types.is_dictionary(f.type) or pa.types.is_timestamp(f.type)}
+    formats = datetime_formats or {}
+
+    os.makedirs(out_dir, exist_ok=True)
+    for old in Path(out_dir).glob("part-*.parquet"):
+        old.unlink()
+    parts: List[str] = []
+    for input_csv in input_csvs:
+        with pd.read_csv(input_csv, chunksize=int(chunksize), dtype={c: str for c in text_cols}, low_memory=False) as reader:
+            for chunk in reader:
+                for col, t in types.items():
+                    if t == "datetime64[ns]" and col in chunk.columns:
+                        chunk[col] = pd.to_datetime(chunk[col], errors="coerce", format=formats.get(col, "mixed"))
+                try:
+                    table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    raise RuntimeError(f"{os.path.basename(input_csv)} does not match inferred types ({e}); re-run inference without --sample-rows") from e
+                part = os.path.join(out_dir, f"part-{len(parts):05d}.parquet")
+                pq.write_table(table, part)
+                parts.append(part)
+    return parts
+
+
+def rewire_inputs(root: Path, old_rel: str, new_rel: str) -> List[Path]:
+    """Point `pipeline_entry_path` and module input paths at `new_rel`.
+
+    The run config keeps the CSV as `pipeline_source_path` so inference can
+    still find it. Rewrites the run config plus `input_path` / `raw_data_path` values in
+    `config/*.yaml` and `config/generated/*.yaml` that reference the old
+    CSV (or a template placeholder under `data/raw/`). Comments are kept.
+    Returns the config files that changed.
+    """
+    update_yaml_keys(root / "config" / "run_toolkit_config.yaml", {"pipeline_entry_path": new_rel, "pipeline_source_path": old_rel})
+
+    def transform(value: str) -> Optional[str]:
+        if value == old_rel or (value.startswith("data/raw/") and value.endswith(".csv")):
+            return new_rel
+        return None
+
+    changed = []
+    for cfg in sorted((root / "config").glob("*.yaml")) + sorted((root / "config" / "generated").glob("*.yaml")):
+        if cfg.name != "run_toolkit_config.yaml" and replace_yaml_scalars(cfg, _INPUT_KEYS, transform):
+            changed.append(cfg)
+    return changed
+
+
+def convert_dataset(
+    root: str,
+    input_csv: str,
+    chunksize: int = 500_000,
+    datetime_hints: Optional[List[str]] = None,
+    max_unique: int = 30,
+    top_n: int = 30,
+) -> str:
+    """Deploy/infer stage: convert the wired CSV to Parquet and rewire configs.
+
+    Dtypes and categorical columns come from the generated validation
+    config when present (so conversion matches inference), otherwise from a
+    fresh profile. Columns with at most `max_unique` and `top_n` distinct
+    values (the inference limits) become categoricals. `input_csv` may be a glob of partitions. Returns the
+    Parquet directory relative to `root`.
+    """
+    from . import infer_configs as ic
+
+    root_p = Path(root).resolve()
+    files = ic.expand_inputs(input_csv)
+    if not files:
+        raise RuntimeError(f"No CSV files match: {input_csv}")
+    generated = root_p / "config" / "generated" / "validation_config_autofill.yaml"
+    if generated.exists():
+        with open(generated, "r", encoding="utf-8") as f:
+            rules = (yaml_load(f) or {}).get("validation", {}).get("schema_validation", {}).get("rules", {})
+        types = rules.get("expected_types") or {}
+        limit = min(max_unique, top_n)
+        cats = [c for c, vals in (rules.get("categorical_values") or {}).items() if len(vals) <= limit]
+    else:
+        profile = reduce(
+            ic.merge_profiles,
+            [ic.profile_csv(f, max_unique=max_unique, datetime_hints=datetime_hints, chunksize=chunksize) for f in files],
+        )
+        types = profile["types"]
+        cats = [c for c in ic.categorical_columns(profile, top_n) if c in profile["objects"]]
+    formats = {}
+    for hint in datetime_hints or []:
+        if ":" in hint:
+            col, fmt = hint.split(":", 1)
+            formats[col.strip()] = fmt.strip()
+
+    # "sales_*.csv" -> "sales"; a bare "*.csv" falls back to "dataset"
+    stem = re.sub(r"[*?\[\]]", "", Path(input_csv).stem).strip("_-") or "dataset"
+    out_dir = root_p / "data" / "processed" / stem
+    convert_to_parquet(files, str(out_dir), types, categoricals=cats, datetime_formats=formats, chunksize=chunksize)
+    old_rel = ic.display_path(input_csv, str(root_p))
+    new_rel = os.path.relpath(out_dir, root_p)
+    rewire_inputs(root_p, old_rel, new_rel)
+    return new_rel
@@ -1,58 +1,126 @@
 """CSV inspection utilities to build suggested YAML configs.
 
-Reads a sample (or full) CSV, infers simple schema information and
-categorical values, and writes three config files under `config/`:
-validation, certification, and outlier detection.
+Reads a sample (or full) CSV, infers simple schema information,
+categorical values and missingness, and writes config files under
+`config/generated/`: validation, certification, outlier detection,
+imputation and diagnostics, plus a machine-readable `profile.json`.
+
+Inference runs on mergeable profiles (`profile_frame` / `merge_profiles`),
+so in-memory DataFrames and chunk iterators can be profiled directly via
+`infer_configs_from_frame` without a CSV/YAML round-trip.
 """
 
 from __future__ import annotations
 
 import glob
+import json
 import os
 import re
-from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
 
+import numpy as np
 import pandas as pd
-import yaml
+
+from .catalog import header_hash, read_header
+from .remote import expand_remote, is_remote, read_csv_sample
+from .utils import update_yaml_keys, yaml_dump, yaml_load
 
 
 def _load_yaml(path: str) -> Dict[str, Any]:
     """Safe-load YAML file into a dict; return empty mapping on null."""
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml_load(f) or {}
 
 
 def _write_yaml(path: str, data: Dict[str, Any]) -> None:
     """Write a dict to YAML with stable, readable formatting."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml_dump(data, f)
 
 
 def _find_entry_csv(root: str) -> str:
     """Infer the input CSV from config or a single file under data/raw.
 
     Preference order:
-    1) `config/run_toolkit_config.yaml` → `pipeline_entry_path`.
+    1) `config/run_toolkit_config.yaml` → `pipeline_entry_path` (a CSV path
+       or glob), else `pipeline_source_path` (the CSV behind a Parquet entry).
     2) Exactly one `*.csv` under `data/raw/`.
+    3) Several `*.csv` under `data/raw/` sharing one header → the
+       `data/raw/*.csv` glob, inferred as a partitioned dataset. Callers
+       expand it; `write_outputs` keeps it out of the generated configs.
     Otherwise, raise with a clear instruction.
     """
     cfg_path = os.path.join(root, "config", "run_toolkit_config.yaml")
     if os.path.exists(cfg_path):
         cfg = _load_yaml(cfg_path)
-        p = (cfg or {}).get("pipeline_entry_path")
-        if p:
+        # After Parquet conversion the entry path is the typed copy; the CSV
+        # it came from is kept as `pipeline_source_path`.
+        for key in ("pipeline_entry_path", "pipeline_source_path"):
+            p = (cfg or {}).get(key)
+            if not p:
+                continue
+            if is_remote(p) and p.endswith(".csv"):
+                return p
             p_abs = os.path.join(root, p) if not os.path.isabs(p) else p
-            if os.path.exists(p_abs):
+            if p_abs.endswith(".csv") and (os.path.exists(p_abs) or (glob.has_magic(p_abs) and glob.glob(p_abs))):
                 return p_abs
     candidates = sorted(glob.glob(os.path.join(root, "data", "raw", "*.csv")))
     if len(candidates) == 1:
         return candidates[0]
+    if len(candidates) > 1 and len({header_hash(read_header(Path(c))) for c in candidates}) == 1:
+        # Same header everywhere: treat data/raw as one partitioned dataset
+        return os.path.join(root, "data", "raw", "*.csv")
     raise RuntimeError(
-        ("Could not determine entry CSV. Set --input or pipeline_entry_path in " "config/run_toolkit_config.yaml or place exactly one CSV in data/raw/.")
+        (
+            "Could not determine entry CSV. Set --input or pipeline_entry_path in "
+            "config/run_toolkit_config.yaml or place exactly one CSV (or same-schema partitions) in data/raw/."
+        )
     )
 
 
+def display_path(path: str, root: str) -> str:
+    """Path as written into configs: relative to `root`, URLs unchanged."""
+    return path if is_remote(path) else os.path.relpath(path, root)
+
+
+def _read_sample(input_csv: str, sample_rows: int | None, datetime_hints: List[str] | None) -> tuple[pd.DataFrame, Dict[str, str]]:
+    """Read the CSV (optionally the first N rows) and apply datetime hints.
+
+    Returns the frame plus a map of hinted columns to their forced dtype.
+    """
+    if is_remote(input_csv):
+        # Range reads: header plus sampled blocks, never the whole object
+        df, _ = read_csv_sample(input_csv, sample_rows=sample_rows)
+        return df, _apply_datetime_hints(df, datetime_hints)
+    read_kwargs: Dict[str, Any] = {"low_memory": False}
+    if sample_rows is not None:
+        read_kwargs["nrows"] = int(sample_rows)
+    df = pd.read_csv(input_csv, **read_kwargs)
+    return df, _apply_datetime_hints(df, datetime_hints)
+
+
+def _apply_datetime_hints(df: pd.DataFrame, datetime_hints: List[str] | None) -> Dict[str, str]:
+    """Parse hinted columns (`col:strftime`) in place; return their forced dtypes."""
+    hinted_types = {}
+    for hint in datetime_hints or []:
+        if ":" not in hint:
+            continue
+        col, fmt = hint.split(":", 1)
+        col = col.strip()
+        fmt = fmt.strip()
+        if col in df.columns:
+            try:
+                df[col] = pd.to_datetime(df[col], format=fmt, errors="coerce")
+                hinted_types[col] = "datetime64[ns]"
+            except Exception:
+                pass
+    return hinted_types
+
+
 def infer_types(df: pd.DataFrame, detect_datetimes: bool = True) -> Dict[str, str]:
     """Map each column to a simple dtype label; optionally detect datetimes.
 
@@ -175,6 +243,800 @@ def build_outlier_config(input_path_rel: str, numeric_cols) -> Dict[str, Any]:
     }
 
 
+def build_imputation_config(profile: Dict[str, Any], max_null_rate: float = 0.5) -> Dict[str, Any]:
+    """Assemble an imputation config with a strategy for each column holding nulls.
+
+    Integral numerics get `median`, other numerics `mean`, booleans and
+    tracked categoricals `mode`, free text `UNKNOWN` and datetimes a
+    placeholder date. Columns missing more than `max_null_rate` of their
+    rows are left out (they are listed in the diagnostics quality checks).
+    """
+    rows = profile["rows"]
+    strategies: Dict[str, Any] = {}
+    for c in profile["columns"]:
+        n = profile["nulls"].get(c, 0)
+        if not n or n > rows * max_null_rate:
+            continue
+        t = profile["types"][c]
+        if t == "bool" or (c in profile["objects"] and c in profile["values"] and c not in profile["capped"]):
+            strategies[c] = "mode"
+        elif c in profile["numeric"]:
+            strategies[c] = "median" if c in profile["integral"] else "mean"
+        elif t.startswith("datetime"):
+            strategies[c] = {"strategy": "constant", "value": "1900-01-01"}
+        else:
+            strategies[c] = {"strategy": "constant", "value": "UNKNOWN"}
+    return {
+        "notebook": True,
+        "run_id": "",
+        "logging": "auto",
+        "imputation": {
+            "run": True,
+            "input_path": "exports/joblib/{run_id}/{run_id}_m06_df_handled.joblib",
+            "rules": {"strategies": strategies},
+            "settings": {
+                "show_inline": True,
+                "export": {"run": True, "as_csv": False, "export_path": "exports/reports/imputation/imputation_report.xlsx"},
+                "plotting": {"run": True, "save_dir": "exports/plots/imputation/"},
+                "checkpoint": {"run": True, "checkpoint_path": "exports/joblib/{run_id}/{run_id}_m07_df_imputed.joblib"},
+            },
+        },
+    }
+
+
+def build_normalization_config(coercions: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Assemble a normalization config that turns numeric/boolean text columns into real dtypes.
+
+    Only uses rules the toolkit's normalization step honors: `value_mappings`
+    (sentinels to null, boolean spellings to True/False, formatted numbers
+    such as "$1,200" or "45%" to their values) followed by `coerce_dtypes`.
+    Columns that can only be coerced while loading (formatted numbers past
+    the value cap) are left to the dtype plan's `read_options`, or not at
+    all (`stage` None).
+    """
+    value_mappings: Dict[str, Dict[str, Any]] = {}
+    coerce_dtypes: Dict[str, str] = {}
+    for c, info in coercions.items():
+        if info["stage"] is None or (info["formats"] and "numbers" not in info):
+            continue
+        mapping: Dict[str, Any] = {v: None for v in info["sentinels"]}
+        mapping.update(info.get("tokens") or {})
+        mapping.update(info.get("numbers") or {})
+        if mapping:
+            value_mappings[c] = mapping
+        coerce_dtypes[c] = info["dtype"]
+    return {
+        "notebook": True,
+        "run_id": "",
+        "logging": "auto",
+        "normalization": {
+            "run": True,
+            "rules": {
+                "value_mappings": value_mappings,
+                "preview_columns": list(value_mappings),
+                "coerce_dtypes": coerce_dtypes,
+            },
+            "settings": {
+                "show_inline": True,
+                "export": True,
+                "as_csv": False,
+                "export_path": "exports/reports/normalization/normalization_report.xlsx",
+                "checkpoint": {"run": True, "checkpoint_path": "exports/joblib/{run_id}/{run_id}_m03_df_normalized.joblib"},
+            },
+        },
+    }
+
+
+def build_diagnostics_config(input_path_rel: str, types: Dict[str, str], missingness: Dict[str, Any]) -> Dict[str, Any]:
+    """Assemble a diagnostics config whose quality checks carry the observed schema and missingness."""
+    return {
+        "notebook": True,
+        "run_id": "",
+        "logging": "auto",
+        "diagnostics": {
+            "input_path": input_path_rel,
+            "profile": {
+                "run": True,
+                "settings": {
+                    "export": True,
+                    "as_csv": False,
+                    "export_path": "exports/reports/diagnostics/diagnostics_summary.xlsx",
+                    "checkpoint": False,
+                    "show_inline": True,
+                    "include_samples": True,
+                    "include_metadata": True,
+                    "max_rows": 5,
+                    "high_cardinality_threshold": 15,
+                    "quality_checks": {
+                        "skew_threshold": 2.0,
+                        "expected_dtypes": types,
+                        "null_rates": {c: r for c, r in missingness["null_rates"].items() if r},
+                        # Pairs missing together in most of their null rows
+                        "co_missing": [p for p in missingness["co_missing"] if p["jaccard"] >= 0.5],
+                        "missingness_patterns": missingness["patterns"],
+                    },
+                },
+            },
+            "plotting": {"run": True, "save_dir": "exports/plots/diagnostics/"},
+        },
+    }
+
+
+# Distinct values kept per object column while profiling chunks; the most
+# frequent survive so top-N category lists stay stable across merges.
+_VALUE_CAP = 1000
+# Distinct missingness patterns kept per profile, most frequent first
+_PATTERN_CAP = 1000
+# Set bits in every byte value, for counting rows in packed bitmaps
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _merge_type(a: str, b: str) -> str:
+    """Reconcile dtype labels seen in two chunks/partitions of one column."""
+    if a == b:
+        return a
+    if {a, b} <= {"int64", "float64"}:
+        return "float64"
+    return "object"
+
+
+def _rekey(counts: Dict[str, int], from_type: str | None, to_type: str) -> Dict[str, int]:
+    """Re-spell int value keys as floats ("1" -> "1.0") when a column widens."""
+    if from_type != "int64" or to_type != "float64":
+        return dict(counts)
+    return {str(float(k)): n for k, n in counts.items()}
+
+
+def _fits_float32(arr: np.ndarray) -> bool:
+    """True if every value has at most 6 significant digits and float32 range.
+
+    Such values (what a CSV typically holds for prices, rates, measures)
+    survive a float32 round trip unchanged when printed back.
+    """
+    arr = arr[np.isfinite(arr) & (arr != 0)]
+    if arr.size == 0:
+        return True
+    mag = np.abs(arr)
+    if mag.max() > 3.4e38 or mag.min() < 1.2e-38:
+        return False
+    scaled = mag / 10.0 ** (np.floor(np.log10(mag)) - 5)
+    return bool(np.all(np.abs(scaled - np.round(scaled)) < 1e-3))
+
+
+def _top_counts(counts: Dict[str, int], cap: int) -> Dict[str, int]:
+    """Keep the `cap` largest counts."""
+    if len(counts) <= cap:
+        return counts
+    return dict(sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:cap])
+
+
+def _add_counts(a: Dict[str, int], b: Dict[str, int]) -> Dict[str, int]:
+    """Sum two count dicts key by key."""
+    out = dict(a)
+    for k, n in b.items():
+        out[k] = out.get(k, 0) + n
+    return out
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Set bits per row of a 2-D uint64 array."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return _POPCOUNT[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+def _missingness(df: pd.DataFrame) -> tuple[int, Dict[str, Dict[str, int]], Dict[str, int]]:
+    """Complete rows, co-null counts per column pair and null-pattern counts.
+
+    Each column with nulls becomes a packed bitmap (one bit per row, in
+    64-bit words), so pair overlaps are word-wise ANDs plus a popcount.
+    Row patterns are the packed null bits per row, counted with
+    `np.unique`; pattern keys are JSON lists of the null columns, sorted so
+    partitions merge cleanly.
+    """
+    mask = df.isna().to_numpy()
+    has_nulls = mask.any(axis=0) if mask.size else np.zeros(len(df.columns), dtype=bool)
+    cols = [str(c) for c, h in zip(df.columns, has_nulls) if h]
+    if not cols:
+        return len(df), {}, {}
+    mask = mask[:, has_nulls]
+    incomplete = mask.any(axis=1)
+    packed = np.packbits(mask.T, axis=1)
+    bitmaps = np.pad(packed, ((0, 0), (0, -packed.shape[1] % 8))).view(np.uint64)
+    pairs: Dict[str, Dict[str, int]] = {}
+    for i, col in enumerate(cols[:-1]):
+        both = _popcount(bitmaps[i] & bitmaps[i + 1 :])
+        for other, n in zip(cols[i + 1 :], both):
+            if n:
+                a, b = sorted((col, other))
+                pairs.setdefault(a, {})[b] = int(n)
+    row_bits = np.ascontiguousarray(np.packbits(mask[incomplete], axis=1))
+    # One opaque value per row makes np.unique a plain 1-D sort
+    uniq, counts = np.unique(row_bits.view(np.dtype((np.void, row_bits.shape[1]))).ravel(), return_counts=True)
+    top = np.argsort(-counts, kind="stable")[:_PATTERN_CAP]
+    flags = np.unpackbits(uniq[top].view(np.uint8).reshape(len(top), -1), axis=1)[:, : len(cols)].astype(bool)
+    patterns = {json.dumps(sorted(c for c, f in zip(cols, row) if f)): int(n) for row, n in zip(flags, counts[top])}
+    return int(len(df) - incomplete.sum()), pairs, patterns
+
+
+def profile_frame(
+    df: pd.DataFrame,
+    max_unique: int = 30,
+    detect_datetimes: bool = True,
+    type_overrides: Dict[str, str] | None = None,
+) -> Dict[str, Any]:
+    """Profile one DataFrame (or chunk) into a mergeable summary.
+
+    The profile is a plain, JSON-friendly dict holding row count, column
+    order, dtype labels, numeric/object columns, numeric ranges, per-column
+    value counts for categorical candidates, the null counts, memory and
+    value-precision facts the dtype plan needs, and the missingness
+    structure (co-null pair counts, null-pattern counts, complete rows)
+    built from packed null bitmaps. Non-object columns stop
+    tracking values once they exceed `max_unique` distinct values; object
+    columns keep the `_VALUE_CAP` most frequent (listed under `capped`).
+    """
+    types = infer_types(df, detect_datetimes=detect_datetimes)
+    types.update(type_overrides or {})
+    values: Dict[str, Dict[str, int]] = {}
+    objects: List[str] = []
+    capped: List[str] = []
+    for col in df.columns:
+        s = df[col]
+        objectish = s.dtype == "object" or str(s.dtype).startswith("category")
+        if objectish:
+            objects.append(col)
+        elif s.nunique(dropna=True) > max_unique:
+            continue
+        vc = s.dropna().astype(str).value_counts()
+        if objectish and len(vc) > _VALUE_CAP:
+            vc = vc.iloc[:_VALUE_CAP]
+            capped.append(col)
+        values[col] = {str(k): int(v) for k, v in vc.items()}
+    numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    integral: List[str] = []
+    float32_ok: List[str] = []
+    for col in numeric:
+        s = df[col]
+        if pd.api.types.is_bool_dtype(s):
+            continue
+        if pd.api.types.is_integer_dtype(s):
+            integral.append(col)
+            continue
+        arr = s.dropna().to_numpy(dtype="float64")
+        if np.array_equal(arr, np.round(arr)):
+            integral.append(col)
+        if _fits_float32(arr):
+            float32_ok.append(col)
+    complete_rows, null_pairs, null_patterns = _missingness(df)
+    return {
+        "rows": int(len(df)),
+        "max_unique": max_unique,
+        "columns": list(df.columns),
+        "types": types,
+        "numeric": numeric,
+        "objects": objects,
+        "ranges": infer_numeric_ranges(df),
+        "values": values,
+        "capped": capped,
+        "nulls": {str(c): int(n) for c, n in df.isna().sum().items()},
+        "mem": {str(c): int(n) for c, n in df.memory_usage(index=False, deep=True).items()},
+        "integral": integral,
+        "float32_ok": float32_ok,
+        "sampled": False,
+        "complete_rows": complete_rows,
+        "null_pairs": null_pairs,
+        "null_patterns": null_patterns,
+    }
+
+
+def merge_profiles(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge two profiles: widened ranges, reconciled types, summed counts.
+
+    Columns are the ordered union; a column stays numeric only if numeric on
+    both sides, and value tracking is dropped when either side overflowed.
+    """
+    cols = list(a["columns"]) + [c for c in b["columns"] if c not in a["columns"]]
+    max_unique = max(a["max_unique"], b["max_unique"])
+    types: Dict[str, str] = {}
+    for c in cols:
+        ta, tb = a["types"].get(c), b["types"].get(c)
+        types[c] = _merge_type(ta, tb) if ta and tb else (ta or tb)
+    numeric = [c for c in cols if (c in a["numeric"] or c not in a["columns"]) and (c in b["numeric"] or c not in b["columns"])]
+    objects = [c for c in cols if c in a["objects"] or c in b["objects"]]
+    capped = [c for c in cols if c in a["capped"] or c in b["capped"]]
+
+    def on_both(key: str) -> List[str]:
+        # Column property that must hold in every profile containing the column
+        return [c for c in cols if (c in a[key] or c not in a["columns"]) and (c in b[key] or c not in b["columns"])]
+
+    ranges: Dict[str, Dict[str, float]] = {}
+    for c in numeric:
+        ra, rb = a["ranges"].get(c), b["ranges"].get(c)
+        if ra and rb:
+            ranges[c] = {"min": min(ra["min"], rb["min"]), "max": max(ra["max"], rb["max"])}
+        elif ra or rb:
+            ranges[c] = dict(ra or rb)
+    values: Dict[str, Dict[str, int]] = {}
+    for c in cols:
+        in_a, in_b = c in a["columns"], c in b["columns"]
+        va, vb = a["values"].get(c), b["values"].get(c)
+        if (in_a and va is None) or (in_b and vb is None):
+            continue
+        merged = _rekey(va or {}, a["types"].get(c), types[c])
+        for k, n in _rekey(vb or {}, b["types"].get(c), types[c]).items():
+            merged[k] = merged.get(k, 0) + n
+        if c in objects:
+            if len(merged) > _VALUE_CAP:
+                merged = dict(sorted(merged.items(), key=lambda kv: kv[1], reverse=True)[:_VALUE_CAP])
+                if c not in capped:
+                    capped.append(c)
+        elif len(merged) > max_unique:
+            continue
+        values[c] = merged
+    null_pairs = {c: _add_counts(a["null_pairs"].get(c, {}), b["null_pairs"].get(c, {})) for c in sorted({*a["null_pairs"], *b["null_pairs"]})}
+    return {
+        "rows": a["rows"] + b["rows"],
+        "max_unique": max_unique,
+        "columns": cols,
+        "types": types,
+        "numeric": numeric,
+        "objects": objects,
+        "ranges": ranges,
+        "values": values,
+        "capped": capped,
+        "nulls": {c: a["nulls"].get(c, 0) + b["nulls"].get(c, 0) for c in cols},
+        "mem": {c: a["mem"].get(c, 0) + b["mem"].get(c, 0) for c in cols},
+        "integral": [c for c in on_both("integral") if c in numeric],
+        "float32_ok": [c for c in on_both("float32_ok") if c in numeric],
+        "sampled": a["sampled"] or b["sampled"],
+        "complete_rows": a["complete_rows"] + b["complete_rows"],
+        "null_pairs": null_pairs,
+        "null_patterns": _top_counts(_add_counts(a["null_patterns"], b["null_patterns"]), _PATTERN_CAP),
+    }
+
+
+def profile_frames(
+    frames: Iterable[pd.DataFrame],
+    max_unique: int = 30,
+    detect_datetimes: bool = True,
+    type_overrides: Dict[str, str] | None = None,
+) -> Dict[str, Any]:
+    """Profile an iterable of DataFrame chunks, merging as it goes.
+
+    Only one chunk is held at a time, so memory is bounded by chunk size.
+    """
+    profile: Dict[str, Any] | None = None
+    for chunk in frames:
+        part = profile_frame(chunk, max_unique=max_unique, detect_datetimes=detect_datetimes, type_overrides=type_overrides)
+        profile = part if profile is None else merge_profiles(profile, part)
+    if profile is None:
+        raise ValueError("No data to profile: the frame iterator was empty.")
+    return profile
+
+
+def summarize_missingness(profile: Dict[str, Any], top_n: int = 10) -> Dict[str, Any]:
+    """Null rates, co-missing column pairs and the most common missingness patterns.
+
+    `co_missing` lists up to `top_n` column pairs that are null in the same
+    rows, with the shared row count and their Jaccard overlap (1.0 means
+    always missing together). `patterns` lists the `top_n` most frequent
+    sets of null columns per row; complete rows are the empty set.
+    """
+    rows = profile["rows"]
+    nulls = profile["nulls"]
+    null_rates = {c: round(nulls.get(c, 0) / rows, 4) if rows else 0.0 for c in profile["columns"]}
+    pairs = []
+    for a, hits in profile["null_pairs"].items():
+        for b, n in hits.items():
+            union = nulls.get(a, 0) + nulls.get(b, 0) - n
+            pairs.append({"columns": [a, b], "rows": n, "jaccard": round(n / union, 4) if union else 0.0})
+    pairs.sort(key=lambda p: (-p["jaccard"], -p["rows"], p["columns"]))
+    counts = [([], profile["complete_rows"])] + [(json.loads(k), n) for k, n in profile["null_patterns"].items()]
+    counts.sort(key=lambda kv: -kv[1])
+    return {
+        "rows": rows,
+        "complete_rows": profile["complete_rows"],
+        "null_rates": null_rates,
+        "co_missing": pairs[:top_n],
+        "patterns": [{"columns": cols, "rows": n, "share": round(n / rows, 4) if rows else 0.0} for cols, n in counts[:top_n] if n],
+    }
+
+
+# Numbers as spreadsheets and BI exports print them: "1,234", "$12.50", "-4.5%"
+_NUMERIC_LIKE = r"[-+]?[$€£¥]?[-+]?(?:\d{1,3}(?:,\d{3})+|\d*)(?:\.\d+)?%?"
+_BOOL_TOKENS = {"true": True, "t": True, "yes": True, "y": True, "false": False, "f": False, "no": False, "n": False}
+# Only count as booleans next to a worded token; bare 0/1 columns are numbers
+_BOOL_DIGITS = {"1": True, "0": False}
+
+
+def _string_dtype() -> Any:
+    """Arrow-backed strings when pyarrow is installed (regexes run in C++), else object."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return object
+    return "string[pyarrow]"
+
+
+def _flags(result: pd.Series) -> np.ndarray:
+    """Plain bool array from a (possibly nullable) string-op result."""
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+def classify_objects(profile: Dict[str, Any], min_share: float = 0.8, max_sentinels: int = 5) -> Dict[str, Dict[str, Any]]:
+    """Find object columns that really hold numbers or booleans.
+
+    One set of pandas string regexes runs over every tracked distinct value
+    of every object column, weighted by its count, so the classifier works
+    on merged profiles and never loops per value in Python. A column is
+    numeric-like (or boolean-like) when at least `min_share` of its values
+    match; the remaining values, at most `max_sentinels` distinct ones, are
+    reported as sentinels (e.g. "N/A", "-", "unknown").
+
+    Returns `{column: {kind, dtype, sentinels, formats, stage}}` where
+    `kind` is `numeric` or `boolean`, `dtype` the coerced dtype and
+    `formats` the number formatting seen (`currency`, `thousands`,
+    `percent`). `stage` says where the coercion happens: `load` (plain or
+    thousands-separated numbers: `na_values`/`thousands` in `read_csv`),
+    `normalize` (`value_mappings` + `coerce_dtypes`), or None when neither
+    can (currency/percent columns past the value cap). Boolean columns also
+    carry `tokens`, each raw spelling mapped to True/False, and formatted
+    columns with every value tracked carry `numbers`, each raw value mapped
+    to its number (percents scaled by 0.01).
+    """
+    cols = [c for c in profile["objects"] if profile["types"].get(c) == "object" and profile["values"].get(c)]
+    if not cols:
+        return {}
+    frame = pd.DataFrame(
+        [(c, v, n) for c in cols for v, n in profile["values"][c].items()],
+        columns=["column", "value", "count"],
+    )
+    text = frame["value"].astype(_string_dtype()).str.strip()
+    lower = text.str.lower()
+    # Zero-padded codes ("00123") are identifiers, not numbers
+    frame["numeric"] = _flags(text.str.fullmatch(_NUMERIC_LIKE) & text.str.contains(r"\d") & ~text.str.match(r"[-+]?0\d"))
+    frame["worded"] = _flags(lower.isin(list(_BOOL_TOKENS)))
+    frame["boolean"] = frame["worded"] | _flags(lower.isin(list(_BOOL_DIGITS)))
+    frame["currency"] = frame["numeric"] & _flags(text.str.contains(r"[$€£¥]"))
+    frame["thousands"] = frame["numeric"] & _flags(text.str.contains(",", regex=False))
+    frame["percent"] = frame["numeric"] & _flags(text.str.endswith("%"))
+    frame["decimal"] = frame["numeric"] & _flags(text.str.contains(".", regex=False))
+    frame["truth"] = lower.astype(object).map({**_BOOL_TOKENS, **_BOOL_DIGITS})
+    number = pd.to_numeric(text.str.replace(r"[$€£¥,%\s]", "", regex=True).astype(object).where(frame["numeric"]), errors="coerce")
+    frame["number"] = number.where(~frame["percent"], number / 100)
+    flags = ["numeric", "boolean", "worded", "currency", "thousands", "percent", "decimal"]
+    weighted = frame[flags].mul(frame["count"], axis=0).groupby(frame["column"], sort=False).sum()
+    totals = frame.groupby("column", sort=False)["count"].sum()
+    out: Dict[str, Dict[str, Any]] = {}
+    for c, rows in frame.groupby("column", sort=False):
+        w, total = weighted.loc[c].copy(), totals.loc[c]
+        if c in profile["capped"] and rows["numeric"].mean() >= min_share:
+            # Rows past the value cap are the long tail of distinct numbers;
+            # frequent sentinels are always among the tracked values
+            tail = profile["rows"] - profile["nulls"].get(c, 0) - total
+            w["numeric"] += tail
+            total += tail
+        # Worded booleans ("yes"/"no") win; 0/1 only joins them, never on its own
+        if w["worded"] > 0 and w["boolean"] >= min_share * total:
+            kind = "boolean"
+        elif w["numeric"] >= min_share * total:
+            kind = "numeric"
+        else:
+            continue
+        bad = rows[~rows[kind]]
+        if len(bad) > max_sentinels:
+            continue
+        sentinels = {str(v): int(n) for v, n in zip(bad["value"], bad["count"])}
+        nullable = bool(sentinels) or profile["nulls"].get(c, 0) > 0
+        if kind == "boolean":
+            dtype = "boolean" if nullable else "bool"
+            tokens = {str(v): bool(t) for v, t in zip(rows["value"], rows["truth"]) if v not in sentinels}
+            out[c] = {"kind": kind, "dtype": dtype, "sentinels": sentinels, "formats": [], "stage": "normalize", "tokens": tokens}
+            continue
+        formats = [f for f in ("currency", "thousands", "percent") if w[f]]
+        capped = c in profile["capped"]
+        # read_csv cannot parse "1,234" straight into Int64, so nullable ints read that way are floats
+        if w["decimal"] or w["percent"] or (nullable and formats == ["thousands"]):
+            dtype = "float64"
+        else:
+            dtype = "Int64" if nullable else "int64"
+        if set(formats) <= {"thousands"}:
+            stage = "load"
+        else:
+            stage = None if capped else "normalize"
+        out[c] = {"kind": kind, "dtype": dtype, "sentinels": sentinels, "formats": formats, "stage": stage}
+        if formats and not capped:
+            good = rows[rows["numeric"]]
+            cast = float if dtype == "float64" else int
+            out[c]["numbers"] = {str(v): cast(n) for v, n in zip(good["value"], good["number"])}
+    return out
+
+
+_INT_WIDTHS = [(8, 2**7), (16, 2**15), (32, 2**31)]
+
+
+def _int_bits(rng: Dict[str, float] | None) -> int:
+    """Smallest signed integer width holding the observed range."""
+    if not rng:
+        return 64
+    for bits, bound in _INT_WIDTHS:
+        if -bound <= rng["min"] and rng["max"] < bound:
+            return bits
+    return 64
+
+
+def infer_dtype_plan(
+    profile: Dict[str, Any],
+    datetime_formats: Dict[str, str] | None = None,
+    coercions: Dict[str, Dict[str, Any]] | None = None,
+    float32: bool = False,
+) -> Dict[str, Any]:
+    """Plan the smallest safe dtype per column from a profile.
+
+    - integer columns: smallest of int8/16/32/64 holding the observed range
+    - integral floats (NaNs forced the float): nullable Int8..Int64
+    - other floats: float32 when `float32` is set and every value has <= 6
+      significant digits (opt-in: it changes stored values, e.g. 100.23)
+    - low-cardinality strings (distinct <= half the non-null rows): category
+    - datetimes: parsed via `parse_dates`
+    - plain or thousands-separated numbers padded with sentinel strings:
+      read as numbers, with the sentinels passed as `na_values` (and
+      `thousands=","`)
+    - other numeric/boolean text that normalization coerces: kept as object
+      (not category), so the normalization rules and certification apply
+
+    Returns per-column `{dtype, bytes_before, bytes_after}` (before = a
+    default `read_csv`), the totals, and a `read_options` block of
+    `pd.read_csv` keyword arguments (`dtype`, `usecols`, `parse_dates`,
+    and `na_values` when sentinels were found). Pass `coercions` from
+    `classify_objects` to skip classifying again.
+
+    Integer widths are only narrowed when the profile covers every row;
+    a sampled profile (`sampled`) keeps int64/Int64, since values outside
+    the sampled range would wrap silently under a narrower dtype.
+    """
+    rows = profile["rows"]
+    sampled = profile["sampled"]
+    if coercions is None:
+        coercions = classify_objects(profile)
+    at_load = {c: info for c, info in coercions.items() if info["stage"] == "load"}
+    # Left as text for the normalization step to clean and coerce
+    normalized = {c for c, info in coercions.items() if info["stage"] == "normalize"}
+    na_values: Dict[str, List[str]] = {}
+    columns: Dict[str, Dict[str, Any]] = {}
+    dtypes: Dict[str, str] = {}
+    parse_dates: List[str] = []
+    for c in profile["columns"]:
+        t = profile["types"][c]
+        before = int(profile["mem"].get(c, 0))
+        nulls = int(profile["nulls"].get(c, 0))
+        dtype, after = t, before
+        if t == "int64":
+            bits = 64 if sampled else _int_bits(profile["ranges"].get(c))
+            dtype, after = f"int{bits}", rows * bits // 8
+        elif t == "float64" and c in profile["integral"] and c in profile["ranges"]:
+            bits = 64 if sampled else _int_bits(profile["ranges"].get(c))
+            dtype, after = f"Int{bits}", rows * (bits // 8 + 1)
+        elif t == "float64" and float32 and c in profile["float32_ok"]:
+            dtype, after = "float32", rows * 4
+        elif t == "bool":
+            dtype, after = ("boolean", rows * 2) if nulls else ("bool", rows)
+        elif t == "datetime64[ns]":
+            parse_dates.append(c)
+            after = rows * 8
+        elif c in at_load:
+            if at_load[c]["sentinels"]:
+                na_values[c] = list(at_load[c]["sentinels"])
+            dtype = at_load[c]["dtype"]
+            after = rows * (9 if dtype == "Int64" else 8)
+        elif t == "object" and c in profile["values"] and c not in normalized and c not in profile["capped"]:
+            counts = profile["values"][c]
+            if counts and len(counts) <= (rows - nulls) / 2:
+                code_bits = _int_bits({"min": -1, "max": len(counts)})
+                dtype = "category"
+                after = rows * code_bits // 8 + sum(len(k) + 49 for k in counts)
+        columns[c] = {"dtype": dtype, "bytes_before": before, "bytes_after": int(after)}
+        if dtype != t:
+            dtypes[c] = dtype
+    read_options: Dict[str, Any] = {"dtype": dtypes, "usecols": list(profile["columns"]), "parse_dates": parse_dates}
+    formats = {c: f for c, f in (datetime_formats or {}).items() if c in parse_dates}
+    if formats:
+        read_options["date_format"] = formats
+    if na_values:
+        read_options["na_values"] = na_values
+    if any("thousands" in info["formats"] for info in at_load.values()):
+        read_options["thousands"] = ","
+    return {
+        "rows": rows,
+        "bytes_before": sum(v["bytes_before"] for v in columns.values()),
+        "bytes_after": sum(v["bytes_after"] for v in columns.values()),
+        "columns": columns,
+        "read_options": read_options,
+    }
+
+
+def categorical_columns(profile: Dict[str, Any], top_n: int = 30) -> List[str]:
+    """Columns whose full value set is known and small enough to validate against.
+
+    Tracked values must be complete (not capped) and at most `max_unique`
+    and `top_n` of them; datetimes are never categorical.
+    """
+    limit = min(profile["max_unique"], top_n)
+    return [
+        c
+        for c in profile["columns"]
+        if c in profile["values"] and 0 < len(profile["values"][c]) <= limit and c not in profile["capped"] and profile["types"].get(c) != "datetime64[ns]"
+    ]
+
+
+def configs_from_profile(
+    profile: Dict[str, Any],
+    input_path_rel: str = "",
+    top_n: int = 30,
+    exclude_patterns: str = "id|uuid|tag",
+) -> Dict[str, Dict[str, Any]]:
+    """Build validation, certification, outlier, normalization, imputation and diagnostics config dicts from a profile."""
+    exclude_re = [re.compile(exclude_patterns)] if exclude_patterns else []
+    cols = profile["columns"]
+    types = {c: profile["types"][c] for c in cols}
+    cats = {c: sorted(profile["values"][c]) for c in categorical_columns(profile, top_n) if not any(p.search(c) for p in exclude_re)}
+    ranges = {c: profile["ranges"][c] for c in cols if c in profile["ranges"]}
+    numeric_cols = [c for c in cols if c in profile["numeric"] and not any(p.search(c) for p in exclude_re)]
+    # Certification runs after loading and normalization, so coerced columns carry their new dtype
+    coercions = classify_objects(profile)
+    coerced = {c: info["dtype"] for c, info in coercions.items() if info["stage"]}
+    certified_types = {c: coerced.get(c, t) for c, t in types.items()}
+    certified_cats = {c: v for c, v in cats.items() if c not in coerced}
+    return {
+        "validation": build_validation_config(input_path_rel, cols, types, cats, ranges, fail_on_error=False),
+        "certification": build_validation_config(input_path_rel, cols, certified_types, certified_cats, ranges, fail_on_error=True),
+        "outliers": build_outlier_config(input_path_rel, numeric_cols),
+        "normalization": build_normalization_config(coercions),
+        "imputation": build_imputation_config(profile),
+        "diagnostics": build_diagnostics_config(input_path_rel, types, summarize_missingness(profile)),
+    }
+
+
+def infer_configs_from_frame(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    input_path_rel: str = "",
+    max_unique: int = 30,
+    exclude_patterns: str = "id|uuid|tag",
+    detect_datetimes: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """In-memory API: profile a DataFrame (or chunk iterator) and return configs.
+
+    Nothing is read from or written to disk. Returns a mapping with
+    `validation`, `certification`, `outliers`, `normalization`,
+    `imputation` and `diagnostics` config dicts; pass `input_path_rel` to
+    fill their `input_path` fields.
+    """
+    frames = [data] if isinstance(data, pd.DataFrame) else data
+    profile = profile_frames(frames, max_unique=max_unique, detect_datetimes=detect_datetimes)
+    return configs_from_profile(profile, input_path_rel, exclude_patterns=exclude_patterns)
+
+
+# File names written by `write_configs`, keyed by `configs_from_profile` output.
+_CONFIG_FILES = {
+    "validation": "validation_config_autofill.yaml",
+    "certification": "certification_config_autofill.yaml",
+    "outliers": "outlier_config_autofill.yaml",
+    "normalization": "normalization_config_autofill.yaml",
+    "imputation": "imputation_config_autofill.yaml",
+    "diagnostics": "diag_config_autofill.yaml",
+}
+
+
+def write_configs(configs: Dict[str, Dict[str, Any]], out_dir: str) -> str:
+    """Write config dicts from `infer_configs_from_frame` as autofill YAMLs."""
+    os.makedirs(out_dir, exist_ok=True)
+    for key, data in configs.items():
+        _write_yaml(os.path.join(out_dir, _CONFIG_FILES.get(key, f"{key}_autofill.yaml")), data)
+    return out_dir
+
+
+def expand_inputs(input_path: str) -> List[str]:
+    """Expand a CSV path, directory or glob into a sorted list of files.
+
+    A directory expands to its `*.csv` files; a pattern containing glob
+    characters expands via `glob`. A plain path is returned as-is.
+    """
+    if is_remote(input_path):
+        return expand_remote(input_path)
+    if os.path.isdir(input_path):
+        return sorted(glob.glob(os.path.join(input_path, "*.csv")))
+    if glob.has_magic(input_path):
+        return sorted(glob.glob(input_path))
+    return [input_path]
+
+
+def profile_csv(
+    input_csv: str,
+    sample_rows: int | None = None,
+    max_unique: int = 30,
+    detect_datetimes: bool = True,
+    datetime_hints: List[str] | None = None,
+    chunksize: int | None = None,
+) -> Dict[str, Any]:
+    """Profile one CSV file, whole or streamed in chunks of `chunksize` rows.
+
+    Top-level (picklable) so partitions can be profiled in worker processes.
+    """
+    hinted_types: Dict[str, str] = {}
+
+    def frames() -> Iterator[pd.DataFrame]:
+        if chunksize is None or is_remote(input_csv):
+            df, hinted = _read_sample(input_csv, sample_rows, datetime_hints)
+            hinted_types.update(hinted)
+            yield df
+            return
+        read_kwargs: Dict[str, Any] = {"low_memory": False, "chunksize": int(chunksize)}
+        if sample_rows is not None:
+            read_kwargs["nrows"] = int(sample_rows)
+        with pd.read_csv(input_csv, **read_kwargs) as reader:
+            for chunk in reader:
+                hinted_types.update(_apply_datetime_hints(chunk, datetime_hints))
+                yield chunk
+
+    profile = profile_frames(frames(), max_unique=max_unique, detect_datetimes=detect_datetimes)
+    profile["types"].update(hinted_types)
+    # Ranges from a sample do not bound the rest of the file
+    profile["sampled"] = sample_rows is not None or is_remote(input_csv)
+    return profile
+
+
+def profile_partitions(files: List[str], max_workers: int | None = None, **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+    """Profile many CSV partitions in parallel, one task per file.
+
+    Uses a process pool sized to the CPU count (never more workers than
+    files); `kwargs` are forwarded to `profile_csv`. Returns profiles keyed
+    by file path, in input order.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    if workers <= 1:
+        return {f: profile_csv(f, **kwargs) for f in files}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(files, pool.map(partial(profile_csv, **kwargs), files)))
+
+
+def partition_deviations(parts: Dict[str, Dict[str, Any]], merged: Dict[str, Any], max_listed: int = 10, top_n: int = 30) -> Dict[str, List[str]]:
+    """Report how each partition deviates from the merged profile.
+
+    Flags columns a partition lacks, dtypes that differ from the reconciled
+    type, and category values seen in no other partition (only for the
+    `categorical_columns` the configs validate; free text and dates always
+    differ between partitions). Partitions without deviations are omitted.
+    """
+    categorical = set(categorical_columns(merged, top_n))
+    part_values = {
+        name: {col: _rekey(counts, prof["types"].get(col), merged["types"][col]) for col, counts in prof["values"].items()} for name, prof in parts.items()
+    }
+    seen_in: Dict[tuple, int] = {}
+    for values in part_values.values():
+        for col, counts in values.items():
+            for v in counts:
+                seen_in[(col, v)] = seen_in.get((col, v), 0) + 1
+    report: Dict[str, List[str]] = {}
+    for name, prof in parts.items():
+        notes: List[str] = []
+        missing = [c for c in merged["columns"] if c not in prof["columns"]]
+        if missing:
+            notes.append(f"missing columns: {missing}")
+        for col, t in prof["types"].items():
+            if t != merged["types"].get(col):
+                notes.append(f"type {t} (merged: {merged['types'].get(col)}): {col}")
+        if len(parts) > 1:
+            for col, counts in part_values[name].items():
+                only = sorted(v for v in counts if seen_in[(col, v)] == 1)
+                if only and col in categorical:
+                    more = f" (+{len(only) - max_listed} more)" if len(only) > max_listed else ""
+                    notes.append(f"exclusive categories: {col} {only[:max_listed]}{more}")
+        if notes:
+            report[name] = notes
+    return report
+
+
 def infer_configs(
     root: str,
     input_path: str | None = None,
@@ -184,65 +1046,224 @@ def infer_configs(
     exclude_patterns: str = "id|uuid|tag",
     detect_datetimes: bool = True,
     datetime_hints: List[str] | None = None,
-) -> str:
+    chunksize: int | None = None,
+    max_workers: int | None = None,
+    float32: bool = False,
+) -> Dict[str, Any]:
     """High-level API: read CSV, infer, and write suggested YAMLs.
 
-    Returns the output directory path where files were written.
+    File-based wrapper over the profile API. `input_path` may be a single
+    CSV, a directory, or a glob; multiple partitions are profiled in
+    parallel, merged (category union, widened ranges, reconciled types)
+    and a `partitions_report.yaml` of per-partition deviations is written
+    alongside the configs. With `chunksize`, each CSV is streamed chunk by
+    chunk instead of loaded whole. `float32` lets the dtype plan downcast
+    short floats.
+    Returns the `write_outputs` summary; `outdir` is where files were written.
     """
     root = os.path.abspath(root)
     input_csv = input_path or _find_entry_csv(root)
-    rel_path = os.path.relpath(input_csv, root)
+    rel_path = display_path(input_csv, root)
+    files = expand_inputs(input_csv)
+    if not files:
+        raise RuntimeError(f"No CSV files match: {input_csv}")
 
-    read_kwargs: Dict[str, Any] = {"low_memory": False}
-    if sample_rows is not None:
-        read_kwargs["nrows"] = int(sample_rows)
-    df = pd.read_csv(input_csv, **read_kwargs)
-    # Apply hints
-    datetime_hints = datetime_hints or []
-    hinted_types = {}
-    for hint in datetime_hints:
-        if ":" not in hint:
-            continue
-        col, fmt = hint.split(":", 1)
-        col = col.strip()
-        fmt = fmt.strip()
-        if col in df.columns:
-            try:
-                df[col] = pd.to_datetime(df[col], format=fmt, errors="coerce")
-                hinted_types[col] = "datetime64[ns]"
-            except Exception:
-                pass
+    opts: Dict[str, Any] = {
+        "sample_rows": sample_rows,
+        "max_unique": max_unique,
+        "detect_datetimes": detect_datetimes,
+        "datetime_hints": datetime_hints,
+        "chunksize": chunksize,
+    }
+    parts = profile_partitions(files, max_workers=max_workers, **opts)
+    return write_outputs(root, rel_path, parts, outdir, exclude_patterns, datetime_hints, float32=float32)
+
+
+def _apply_read_options(root: str, inputs: Iterable[str], read_options: Dict[str, Any]) -> bool:
+    """Store the dtype plan's `read_options` in the run config.
+
+    Only when `pipeline_entry_path` is the profiled CSV (or glob), so a
+    plan for some other file never lands in the pipeline. Returns True if
+    the run config was updated.
+    """
+    cfg_path = Path(root) / "config" / "run_toolkit_config.yaml"
+    if not cfg_path.exists():
+        return False
+    entry = (_load_yaml(str(cfg_path)) or {}).get("pipeline_entry_path")
+    if entry not in set(inputs):
+        return False
+    update_yaml_keys(cfg_path, {"read_options": read_options})
+    return True
+
+
+def write_outputs(
+    root: str,
+    rel_path: str,
+    parts: Dict[str, Dict[str, Any]],
+    outdir: str | None = None,
+    exclude_patterns: str = "id|uuid|tag",
+    datetime_hints: List[str] | None = None,
+    float32: bool = False,
+) -> Dict[str, Any]:
+    """Merge per-file profiles and write every generated artefact.
+
+    Writes the autofill configs, the dtype plan (with its `read_options`
+    block, also stored in the run config when it reads this input),
+    `profile.json` (schema, null counts and missingness summary) and, for
+    several files, `partitions_report.yaml`. Shared by
+    `infer_configs` and watch mode, which keeps `parts` cached between runs.
+    The toolkit loads one file per module, so the generated files name the
+    first partition; a glob or directory `rel_path` is kept only in the
+    partitions report. Returns a summary for reporting: `outdir`, `input`,
+    `rows`, `partitions`, `deviations` (per partition), the plan's
+    `bytes_before` / `bytes_after`, `missingness`, `coercions` and
+    `read_options_written`.
+    """
+    files = list(parts)
+    entry = display_path(min(files), root)
+    profile = reduce(merge_profiles, parts.values())
+    configs = configs_from_profile(profile, entry, exclude_patterns=exclude_patterns)
+    out_dir = write_configs(configs, outdir or os.path.join(root, "config", "generated"))
+    formats = dict(h.split(":", 1) for h in datetime_hints or [] if ":" in h)
+    coercions = classify_objects(profile)
+    plan = infer_dtype_plan(profile, {c.strip(): f.strip() for c, f in formats.items()}, coercions, float32=float32)
+    _write_yaml(os.path.join(out_dir, "dtype_plan_autofill.yaml"), {"input": entry, **plan})
+    written = _apply_read_options(root, {rel_path, entry}, plan["read_options"])
+    summary = {
+        "input": entry,
+        "rows": profile["rows"],
+        "columns": profile["columns"],
+        "types": profile["types"],
+        "nulls": profile["nulls"],
+        "missingness": summarize_missingness(profile, top_n=20),
+        "coercions": coercions,
+    }
+    with open(os.path.join(out_dir, "profile.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    report_path = os.path.join(out_dir, "partitions_report.yaml")
+    deviations: Dict[str, List[str]] = {}
+    if len(files) > 1:
+        deviations = {display_path(f, root): notes for f, notes in partition_deviations(parts, profile).items()}
+        _write_yaml(
+            report_path,
+            {
+                "input": rel_path,
+                "config_input_path": entry,
+                "partitions": len(files),
+                "rows": profile["rows"],
+                "deviations": deviations,
+            },
+        )
+    elif os.path.exists(report_path):
+        # Drop a stale report from an earlier multi-partition run
+        os.remove(report_path)
+    return {
+        "outdir": out_dir,
+        "input": entry,
+        "rows": profile["rows"],
+        "partitions": len(files),
+        "deviations": deviations,
+        "bytes_before": plan["bytes_before"],
+        "bytes_after": plan["bytes_after"],
+        "missingness": summary["missingness"],
+        "coercions": coercions,
+        "read_options_written": written,
+    }
+
+
+# Observed dtypes that a previously inferred dtype still accepts (a sample
+# without NaNs reads an int column as int64 even if the full file had floats).
+_COMPATIBLE_TYPES = {("float64", "int64")}
+
+
+def check_configs(
+    root: str,
+    input_path: str | None = None,
+    outdir: str | None = None,
+    sample_rows: int | None = 10000,
+    max_unique: int = 30,
+    top_n: int = 30,
+    exclude_patterns: str = "id|uuid|tag",
+    detect_datetimes: bool = True,
+    datetime_hints: List[str] | None = None,
+) -> List[str]:
+    """Compare a CSV (or each partition of a glob/directory) against a previously generated validation config.
+
+    Reads only the header and the first `sample_rows` rows, then checks
+    columns, inferred types, numeric ranges and category sets against
+    `validation_config_autofill.yaml`. Nothing is written. Returns a list
+    of human-readable drift messages (empty when the extract still matches).
+    """
+    root = os.path.abspath(root)
+    input_csv = input_path or _find_entry_csv(root)
+    out_dir = outdir or os.path.join(root, "config", "generated")
+    cfg_path = os.path.join(out_dir, "validation_config_autofill.yaml")
+    if not os.path.exists(cfg_path):
+        raise RuntimeError(f"No generated config to check against: {cfg_path}. Run analyst-infer-configs first.")
+    rules = _load_yaml(cfg_path).get("validation", {}).get("schema_validation", {}).get("rules", {})
+
+    files = expand_inputs(input_csv)
+    if not files:
+        raise RuntimeError(f"No CSV files match: {input_csv}")
+    drift: List[str] = []
+    for f in files:
+        msgs = _check_file(f, rules, sample_rows, max_unique, top_n, exclude_patterns, detect_datetimes, datetime_hints)
+        if len(files) > 1:
+            msgs = [f"{os.path.basename(f)}: {m}" for m in msgs]
+        drift.extend(msgs)
+    return drift
+
+
+def _check_file(
+    input_csv: str,
+    rules: Dict[str, Any],
+    sample_rows: int | None,
+    max_unique: int,
+    top_n: int,
+    exclude_patterns: str,
+    detect_datetimes: bool,
+    datetime_hints: List[str] | None,
+) -> List[str]:
+    """Drift messages for one CSV against validation `rules`."""
+    drift: List[str] = []
+    df, hinted_types = _read_sample(input_csv, sample_rows, datetime_hints)
+    header = list(df.columns)
+    expected_cols = list(rules.get("expected_columns") or [])
+    missing = [c for c in expected_cols if c not in header]
+    extra = [c for c in header if c not in expected_cols]
+    if missing:
+        drift.append(f"missing columns: {missing}")
+    if extra:
+        drift.append(f"unexpected columns: {extra}")
+    if not missing and not extra and header != expected_cols:
+        drift.append("column order changed")
 
-    cols = list(df.columns)
     types = infer_types(df, detect_datetimes=detect_datetimes)
     types.update(hinted_types)
-    exclude_re = [re.compile(exclude_patterns)] if exclude_patterns else []
-    cats = infer_categoricals(df, max_unique=max_unique, exclude_patterns=exclude_re)
-    ranges = infer_numeric_ranges(df)
-
-    validation = build_validation_config(
-        rel_path,
-        cols,
-        types,
-        cats,
-        ranges,
-        fail_on_error=False,
-    )
-    certification = build_validation_config(
-        rel_path,
-        cols,
-        types,
-        cats,
-        ranges,
-        fail_on_error=True,
-    )
-    numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
-    numeric_cols = [c for c in numeric_cols if not any(p.search(c) for p in exclude_re)]
-    outliers = build_outlier_config(rel_path, numeric_cols)
+    for col, exp in (rules.get("expected_types") or {}).items():
+        got = types.get(col)
+        if got is None or got == exp or (exp, got) in _COMPATIBLE_TYPES:
+            continue
+        drift.append(f"type changed: {col} {exp} -> {got}")
 
-    out_dir = outdir or os.path.join(root, "config", "generated")
-    os.makedirs(out_dir, exist_ok=True)
-    _write_yaml(os.path.join(out_dir, "validation_config_autofill.yaml"), validation)
-    _write_yaml(os.path.join(out_dir, "certification_config_autofill.yaml"), certification)
-    _write_yaml(os.path.join(out_dir, "outlier_config_autofill.yaml"), outliers)
-    return out_dir
+    for col, rng in (rules.get("numeric_ranges") or {}).items():
+        if col not in df.columns or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        s_clean = df[col].dropna()
+        if s_clean.empty:
+            continue
+        lo, hi = float(s_clean.min()), float(s_clean.max())
+        if lo < rng.get("min", lo) or hi > rng.get("max", hi):
+            drift.append(f"range widened: {col} [{rng.get('min')}, {rng.get('max')}] -> [{lo}, {hi}]")
+
+    exclude_re = [re.compile(exclude_patterns)] if exclude_patterns else []
+    cats = infer_categoricals(df, max_unique=max_unique, top_n=top_n, exclude_patterns=exclude_re)
+    for col, exp_vals in (rules.get("categorical_values") or {}).items():
+        # A list at the top-N cap was truncated at inference time; new values are expected.
+        if col not in cats or len(exp_vals) >= top_n:
+            continue
+        new_vals = sorted(set(cats[col]) - {str(v) for v in exp_vals})
+        if new_vals:
+            drift.append(f"new categories: {col} {new_vals}")
+    return drift
@@ -0,0 +1,305 @@
+"""Dry-run resource planner for the toolkit pipeline.
+
+Combines a fast profile of `pipeline_entry_path` (row count from a byte
+scan or Parquet metadata, a sampled dtype plan) with simple per-module cost
+models to estimate peak memory, checkpoint sizes and runtime for the
+modules enabled in `config/run_toolkit_config.yaml`, and flags settings
+that will not scale (xlsx exports past Excel's row limit, inline plots on
+wide tables, peaks close to physical RAM).
+
+All figures are estimates: runtimes are calibrated against how long the
+sample took to parse on this machine, memory against the sample's
+in-memory size.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+from . import infer_configs as ic
+from .catalog import count_rows
+from .remote import is_remote, read_csv_sample
+from .utils import yaml_load
+
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLS = 16_384
+# Above this many cells an openpyxl export takes minutes rather than seconds
+EXCEL_SLOW_CELLS = 5_000_000
+# More inline figures than this make a notebook sluggish to render and save
+INLINE_PLOT_LIMIT = 50
+
+# On-disk size of a checkpoint relative to the in-memory frame, by format
+_CHECKPOINT_RATIO = {".joblib": 1.0, ".feather": 0.5, ".parquet": 0.3}
+# Checkpoint write throughput (bytes/s), a conservative local-disk figure
+_WRITE_BPS = 300 * 1024 * 1024
+
+
+def _read_config(path: Path) -> Dict[str, Any]:
+    """Load a YAML config as a mapping (empty when the file is empty)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml_load(f) or {}
+
+
+def _entry_files(root: Path, input_path: str | None, run_cfg: Dict[str, Any]) -> List[str]:
+    """Resolve the planned input to CSV files or Parquet part files."""
+    entry = input_path or run_cfg.get("pipeline_entry_path") or ""
+    if not entry:
+        entry = ic._find_entry_csv(str(root))
+    if is_remote(entry):
+        return ic.expand_inputs(entry)
+    path = Path(entry) if os.path.isabs(entry) else root / entry
+    if path.is_dir():
+        files = sorted(str(p) for p in path.glob("*.parquet")) or sorted(str(p) for p in path.glob("*.csv"))
+    else:
+        files = ic.expand_inputs(str(path))
+    files = [f for f in files if os.path.isfile(f)]
+    if not files:
+        raise RuntimeError(f"Pipeline entry not found: {entry}")
+    return files
+
+
+def _profile_entry(files: List[str], sample_rows: int) -> Dict[str, Any]:
+    """Count rows and profile a timed sample of the first file.
+
+    Only the sample read is timed; row counting scans whole files and
+    would inflate the per-cell cost by the dataset/sample size ratio. For
+    remote inputs only the parse of the fetched bytes is timed, not the
+    network fetch.
+    """
+    first = files[0]
+    if is_remote(first):
+        sample, stats = read_csv_sample(first, sample_rows=sample_rows)
+        read_seconds = stats["parse_seconds"]
+        # Row count and size are estimated from the sampled row width
+        rows = stats["estimated_rows"] * len(files)
+        disk_bytes = stats["size"] * len(files)
+    elif first.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Planning a Parquet entry requires pyarrow: pip install 'analyst_toolkit_deploy[parquet]'") from e
+
+        start = time.perf_counter()
+        # One row group, not the whole part file
+        part = pq.ParquetFile(first)
+        table = part.read_row_group(0) if part.num_row_groups else part.schema_arrow.empty_table()
+        sample = table.to_pandas().head(sample_rows)
+        read_seconds = time.perf_counter() - start
+        rows = sum(pq.ParquetFile(f).metadata.num_rows for f in files)
+        disk_bytes = sum(os.path.getsize(f) for f in files)
+    else:
+        start = time.perf_counter()
+        sample = pd.read_csv(first, nrows=sample_rows, low_memory=False)
+        read_seconds = time.perf_counter() - start
+        rows = sum(count_rows(Path(f)) for f in files)
+        disk_bytes = sum(os.path.getsize(f) for f in files)
+    profile = ic.profile_frame(sample)
+    profile["sampled"] = rows > len(sample)
+    plan = ic.infer_dtype_plan(profile)
+    n = max(len(sample), 1)
+    return {
+        "rows": rows,
+        "columns": len(sample.columns),
+        "numeric": len(profile["numeric"]),
+        "row_bytes": plan["bytes_before"] / n,
+        "row_bytes_planned": plan["bytes_after"] / n,
+        "cell_seconds": read_seconds / (n * max(len(sample.columns), 1)),
+        "disk_bytes": disk_bytes,
+    }
+
+
+def _walk(node: Any, enabled: bool = True, path: str = "") -> Iterator[Tuple[str, str, Any, Dict[str, Any], bool]]:
+    """Yield (path, key, value, parent, enabled) for every mapping entry.
+
+    A block is disabled when its own `run` (or `export`/`export_report`)
+    flag is false; `<name>_path` values follow a sibling `<name>` boolean.
+    """
+    if not isinstance(node, dict):
+        return
+    for flag in ("run", "export", "export_report"):
+        if node.get(flag) is False:
+            enabled = False
+    for key, value in node.items():
+        on = enabled
+        toggle = key[:-5] if key.endswith("_path") else None
+        if toggle and isinstance(node.get(toggle), bool):
+            on = enabled and node[toggle]
+        yield f"{path}.{key}" if path else key, key, value, node, on
+        if isinstance(value, dict):
+            yield from _walk(value, on, f"{path}.{key}" if path else key)
+
+
+def _module_body(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the module block of a config (the first top-level mapping)."""
+    return next((v for v in cfg.values() if isinstance(v, dict)), {})
+
+
+# Per-module cost models: (peak bytes above the input frame, work in units
+# of "parse one cell", bytes added to the frame). `f` holds frame facts.
+def _cost_diagnostics(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    return 0.5 * f["frame"], 2.0 * f["cells"], 0.0
+
+
+def _cost_validation(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    # One boolean mask per rule column
+    return float(f["cells"]), 0.5 * f["cells"], 0.0
+
+
+def _cost_copy(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    return float(f["frame"]), 1.0 * f["cells"], 0.0
+
+
+def _cost_duplicates(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    subset = body.get("subset_columns") or []
+    width = len(subset) or f["columns"]
+    # duplicated() factorizes each subset column to int64 codes, then hashes rows
+    hashing = 8.0 * f["rows"] * (width + 1)
+    return hashing + f["frame"], 1.5 * f["rows"] * width, 0.0
+
+
+def _cost_outliers(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    specs = [c for c in body.get("detection_specs") or {} if c != "__default__"]
+    n = len(specs) or f["numeric"]
+    # Quantiles sort one float64 copy per column; flags add a bool column each
+    added = float(f["rows"] * n) if body.get("append_flags", True) else 0.0
+    return 16.0 * f["rows"] + added, 3.0 * f["rows"] * n, added
+
+
+def _cost_final_audit(f: Dict[str, Any], body: Dict[str, Any]) -> Tuple[float, float, float]:
+    # Working copy plus the certification masks
+    return f["frame"] + f["cells"], 2.0 * f["cells"], 0.0
+
+
+_COST_MODELS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Tuple[float, float, float]]] = {
+    "diagnostics": _cost_diagnostics,
+    "validation": _cost_validation,
+    "validation_gatekeeper": _cost_validation,
+    "normalization": _cost_copy,
+    "duplicates": _cost_duplicates,
+    "outlier_detection": _cost_outliers,
+    "outlier_handling": _cost_copy,
+    "imputation": _cost_copy,
+    "final_audit": _cost_final_audit,
+}
+
+
+# Modules whose plotting draws one figure per column (others draw summaries)
+_PER_COLUMN_PLOTS = {"diagnostics", "outlier_detection", "imputation"}
+
+
+def _plot_count(name: str, body: Dict[str, Any], plotting: Dict[str, Any], facts: Dict[str, Any]) -> int:
+    """Figures a plotting block will draw: per column, times plot types."""
+    kinds = len(plotting.get("plot_types") or [None])
+    if name not in _PER_COLUMN_PLOTS:
+        return kinds
+    specs = [c for c in body.get("detection_specs") or {} if c != "__default__"]
+    return (len(specs) or (facts["numeric"] if name == "outlier_detection" else facts["columns"])) * kinds
+
+
+def _module_flags(name: str, cfg: Dict[str, Any], facts: Dict[str, Any]) -> Tuple[float, List[str]]:
+    """Return checkpoint bytes written by a module and its risk flags."""
+    rows, cols = facts["rows"], facts["columns"]
+    body = _module_body(cfg)
+    notebook = bool(cfg.get("notebook", cfg.get("notebook_mode", False)))
+    checkpoint_bytes = 0.0
+    flags: List[str] = []
+    for path, key, value, parent, on in _walk(cfg):
+        if not on:
+            continue
+        if isinstance(value, str) and key in ("checkpoint_path", "checkpoint_joblib", "checkpoint_csv"):
+            ext = os.path.splitext(value)[1]
+            if ext == ".csv":
+                checkpoint_bytes += facts["disk_bytes"]
+            else:
+                checkpoint_bytes += facts["frame"] * _CHECKPOINT_RATIO.get(ext, 1.0)
+        # An .xlsx path is only written as Excel unless a sibling switches to CSV
+        if isinstance(value, str) and value.endswith(".xlsx") and parent.get("export_format", "xlsx") == "xlsx" and not parent.get("as_csv"):
+            if rows > EXCEL_MAX_ROWS or cols > EXCEL_MAX_COLS:
+                flags.append(f"{path}: xlsx export on {rows:,} rows x {cols} cols exceeds Excel's {EXCEL_MAX_ROWS:,}-row sheet limit; use CSV")
+            elif rows * cols > EXCEL_SLOW_CELLS:
+                flags.append(f"{path}: xlsx export of up to {rows * cols:,} cells will be slow; consider CSV")
+        if isinstance(value, dict) and "plot" in key and value.get("run", True):
+            inline = value.get("show_plots_inline", value.get("show_inline", notebook))
+            figures = _plot_count(name, body, value, facts)
+            if inline and figures > INLINE_PLOT_LIMIT:
+                flags.append(f"{path}: ~{figures} inline figures on a {cols}-column table; set show_plots_inline/notebook false")
+    return checkpoint_bytes, flags
+
+
+def plan_pipeline(root: str, input_path: str | None = None, sample_rows: int = 50_000) -> Dict[str, Any]:
+    """Estimate memory, checkpoint sizes and runtime for enabled modules.
+
+    Returns a JSON-friendly report: input facts, one entry per module
+    (`peak_bytes`, `checkpoint_bytes`, `seconds`, `flags`) in run-config
+    order, totals, and pipeline-wide flags. Without a run config only the
+    load is estimated, and `input_path` is required. Raises RuntimeError
+    when the input or run config cannot be found.
+    """
+    root_p = Path(root).resolve()
+    run_path = root_p / "config" / "run_toolkit_config.yaml"
+    if run_path.is_file():
+        run_cfg = _read_config(run_path)
+    elif input_path:
+        run_cfg = {}
+    else:
+        raise RuntimeError(f"No run config at {run_path}; run from a project root (or --target) or pass --input")
+    files = _entry_files(root_p, input_path, run_cfg)
+    entry = _profile_entry(files, sample_rows)
+    rows = entry["rows"]
+    facts: Dict[str, Any] = {
+        "rows": rows,
+        "columns": entry["columns"],
+        "numeric": entry["numeric"],
+        "cells": rows * entry["columns"],
+        "frame": entry["row_bytes"] * rows,
+        "disk_bytes": entry["disk_bytes"],
+    }
+    cell_seconds = entry["cell_seconds"]
+    load_seconds = cell_seconds * facts["cells"]
+    # read_csv holds parser buffers alongside the frame while loading
+    peak = 2.0 * facts["frame"]
+    modules: List[Dict[str, Any]] = []
+    for name, spec in (run_cfg.get("modules") or {}).items():
+        if not isinstance(spec, dict) or not spec.get("run", False):
+            continue
+        cfg_path = root_p / str(spec.get("config_path", ""))
+        cfg = _read_config(cfg_path) if cfg_path.is_file() else {}
+        extra, work, added = _COST_MODELS.get(name, _cost_copy)(facts, _module_body(cfg))
+        facts["frame"] += added
+        checkpoint_bytes, module_flags = _module_flags(name, cfg, facts)
+        module_peak = facts["frame"] + extra
+        peak = max(peak, module_peak)
+        modules.append(
+            {
+                "module": name,
+                "peak_bytes": int(module_peak),
+                "checkpoint_bytes": int(checkpoint_bytes),
+                "seconds": round(work * cell_seconds + checkpoint_bytes / _WRITE_BPS, 2),
+                "flags": module_flags,
+            }
+        )
+    flags: List[str] = []
+    try:
+        ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        ram = 0
+    if ram and peak > 0.7 * ram:
+        flags.append(f"estimated peak {peak / 2**30:.1f} GiB is over 70% of physical RAM ({ram / 2**30:.1f} GiB); apply read_options or convert to Parquet")
+    return {
+        "input": [ic.display_path(f, str(root_p)) for f in files],
+        "rows": rows,
+        "columns": entry["columns"],
+        "frame_bytes": int(entry["row_bytes"] * rows),
+        "frame_bytes_planned": int(entry["row_bytes_planned"] * rows),
+        "load_seconds": round(load_seconds, 2),
+        "modules": modules,
+        "peak_bytes": int(peak),
+        "checkpoint_bytes": sum(m["checkpoint_bytes"] for m in modules),
+        "seconds": round(load_seconds + sum(m["seconds"] for m in modules), 2),
+        "flags": flags,
+    }
@@ -0,0 +1,287 @@
+"""Local profiling service with a warm worker pool.
+
+A long-running JSON-over-HTTP service (TCP on localhost, or a Unix socket)
+so scripts and notebooks share one set of pre-warmed worker processes and
+one profile cache instead of each paying import and read costs:
+
+- `POST /profile` `{"path": ..., <profile_csv options>}` -> profile dict
+- `POST /infer` `{"root": ..., "input_path": ..., "outdir": ..., "float32": ...}` -> `write_outputs` summary
+- `POST /check` `{"root": ..., "input_path": ...}` -> drift messages
+- `GET /metrics` -> request counts/latencies and cache hit rates
+- `GET /health`
+
+Profiles are cached by file fingerprint (path, size, mtime) plus options,
+so repeat requests for an unchanged extract are answered from memory, and
+concurrent requests for the same file share one computation. A semaphore
+caps in-flight requests; callers over the limit get 503 after a short wait.
+Every endpoint only touches local files below the server's `root`: paths,
+project roots and output folders resolving outside it are rejected with
+403. Remote URLs are read as given.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+
+from rich import print
+
+from . import infer_configs as ic
+from .remote import is_remote, stat_remote
+
+# Options forwarded to `profile_csv`; anything else in a request is ignored
+_PROFILE_OPTIONS = ("sample_rows", "max_unique", "detect_datetimes", "datetime_hints", "chunksize")
+
+
+def _warm() -> int:
+    """Worker initialiser: import the heavy modules once per process."""
+    import pandas  # noqa: F401
+
+    from . import infer_configs  # noqa: F401
+
+    return os.getpid()
+
+
+def _fingerprint(path: str) -> Tuple[str, int, int | str]:
+    if is_remote(path):
+        # Size plus the block cache key (URL, size and ETag/mtime)
+        _, _, size, key = stat_remote(path)
+        return (path, size, key)
+    st = os.stat(path)
+    return (os.path.realpath(path), st.st_size, st.st_mtime_ns)
+
+
+class ProfileService:
+    """Worker pool, profile cache and metrics behind the HTTP handler."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        cache_size: int = 256,
+        max_concurrent: int = 32,
+        queue_timeout: float = 5.0,
+        root: str | None = None,
+    ) -> None:
+        self.root = os.path.realpath(root or os.getcwd())
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        # Start every worker now so the first requests do not pay for it
+        for f in [self.pool.submit(_warm) for _ in range(self.workers)]:
+            f.result()
+        self.cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.cache_size = cache_size
+        self.inflight: Dict[tuple, Future] = {}
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.queue_timeout = queue_timeout
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+    def profile(self, path: str, **options: Any) -> Dict[str, Any]:
+        """Profile one CSV (local paths confined to the root) through the cache and the worker pool."""
+        path = self.local(path)
+        opts = {k: options[k] for k in _PROFILE_OPTIONS if options.get(k) is not None}
+        key = (_fingerprint(path), json.dumps(opts, sort_keys=True))
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.cache_hits += 1
+                return self.cache[key]
+            self.cache_misses += 1
+            future = self.inflight.get(key)
+            if future is None:
+                future = self.pool.submit(ic.profile_csv, path, **opts)
+                self.inflight[key] = future
+        try:
+            result = future.result()
+        finally:
+            with self.lock:
+                self.inflight.pop(key, None)
+        with self.lock:
+            self.cache[key] = result
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return result
+
+    def confine(self, path: str) -> str:
+        """Resolve `path` (relative to the service root) or raise PermissionError if it leaves the root."""
+        resolved = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([resolved, self.root]) != self.root:
+            raise PermissionError(f"Path outside the service root {self.root}: {path}")
+        return resolved
+
+    def local(self, path: str, base: str = "") -> str:
+        """`confine` a local path (relative to `base`, else the root); remote URLs pass through."""
+        return path if is_remote(path) else self.confine(os.path.join(base, path))
+
+    def infer(
+        self,
+        root: str,
+        input_path: str | None = None,
+        outdir: str | None = None,
+        exclude_patterns: str = "id|uuid|tag",
+        float32: bool = False,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """`infer_configs` with every partition profiled through the cache.
+
+        `root`, `outdir` and a local `input_path` must resolve inside the
+        service root.
+        """
+        root = self.confine(root)
+        outdir = self.confine(os.path.join(root, outdir)) if outdir else None
+        input_csv = self.local(input_path, root) if input_path else ic._find_entry_csv(root)
+        files = ic.expand_inputs(input_csv)
+        if not files:
+            raise RuntimeError(f"No CSV files match: {input_csv}")
+        # Fan out through the cache so each partition is profiled (or served) independently
+        with ThreadPoolExecutor(max_workers=min(len(files), self.workers)) as fan:
+            parts = dict(zip(files, fan.map(lambda f: self.profile(f, **options), files)))
+        return ic.write_outputs(root, ic.display_path(input_csv, root), parts, outdir, exclude_patterns, options.get("datetime_hints"), float32=float32)
+
+    def check(self, root: str, input_path: str | None = None, outdir: str | None = None, **options: Any) -> List[str]:
+        """Drift check, run in a worker process, confined like `infer`."""
+        root = self.confine(root)
+        input_path = self.local(input_path, root) if input_path else None
+        outdir = self.confine(os.path.join(root, outdir)) if outdir else None
+        return self.pool.submit(ic.check_configs, root, input_path=input_path, outdir=outdir, **options).result()
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        with self.lock:
+            m = self.metrics.setdefault(endpoint, {"requests": 0, "errors": 0, "latencies_ms": []})
+            m["requests"] += 1
+            m["errors"] += 0 if ok else 1
+            m["latencies_ms"].append(seconds * 1000)
+            del m["latencies_ms"][:-1000]  # keep a rolling window
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            endpoints = {}
+            for name, m in self.metrics.items():
+                lat = sorted(m["latencies_ms"])
+                endpoints[name] = {
+                    "requests": m["requests"],
+                    "errors": m["errors"],
+                    "p50_ms": round(lat[len(lat) // 2], 2) if lat else None,
+                    "p95_ms": round(lat[int(len(lat) * 0.95)], 2) if lat else None,
+                    "max_ms": round(lat[-1], 2) if lat else None,
+                }
+            return {
+                "workers": self.workers,
+                "cache": {"entries": len(self.cache), "hits": self.cache_hits, "misses": self.cache_misses},
+                "endpoints": endpoints,
+            }
+
+
+def _make_handler(service: ProfileService) -> type:
+    routes: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        "/profile": lambda body: service.profile(body.pop("path"), **body),
+        "/infer": lambda body: service.infer(**body),
+        "/check": lambda body: {"drift": service.check(**body)},
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "analyst-toolkit-profile/1"
+
+        def _send(self, status: int, payload: Any) -> None:
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if self.path == "/metrics":
+                self._send(200, service.snapshot())
+            elif self.path == "/health":
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"error": f"unknown endpoint {self.path}"})
+
+        def do_POST(self) -> None:
+            route = routes.get(self.path)
+            if route is None:
+                self._send(404, {"error": f"unknown endpoint {self.path}"})
+                return
+            if not service.slots.acquire(timeout=service.queue_timeout):
+                self._send(503, {"error": "service busy, retry later"})
+                return
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                status, payload = 200, {"result": route(body)}
+            except (KeyError, TypeError, ValueError) as e:
+                status, payload = 400, {"error": f"bad request: {e}"}
+            except PermissionError as e:
+                status, payload = 403, {"error": str(e)}
+            except (FileNotFoundError, RuntimeError) as e:
+                status, payload = 422, {"error": str(e)}
+            except Exception as e:  # e.g. a CSV the parser rejects
+                status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+            finally:
+                service.slots.release()
+            elapsed = time.perf_counter() - start
+            service.record(self.path, elapsed, status == 200)
+            payload["ms"] = round(elapsed * 1000, 2)
+            self._send(status, payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            # Unix-socket clients have no address; quiet per-request logging
+            return
+
+    return Handler
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self) -> Tuple[Any, Any]:
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+    workers: int | None = None,
+    cache_size: int = 256,
+    max_concurrent: int = 32,
+    root: str | None = None,
+) -> None:
+    """Run the service until interrupted (TCP on `host:port` or a Unix socket).
+
+    Endpoints only read and write below `root` (default: the current directory).
+    """
+    service = ProfileService(workers=workers, cache_size=cache_size, max_concurrent=max_concurrent, root=root)
+    handler = _make_handler(service)
+    server: socketserver.BaseServer
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = _UnixHTTPServer(socket_path, handler)
+        where = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        where = f"http://{host}:{port}"
+    print(f"[green]Profiling service on {where}[/green] ({service.workers} warm workers, cache {cache_size}, confined to {service.root})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
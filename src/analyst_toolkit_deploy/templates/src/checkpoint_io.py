@@ -0,0 +1,118 @@
+"""Checkpoint reader/writer for pipeline stages.
+
+The toolkit modules always write `exports/joblib/...joblib` pickles.
+`export_checkpoint` mirrors one of them in the format chosen with
+`analyst-deploy --checkpoint-format` (`CHECKPOINT_FORMAT` in `.env`) under
+`exports/<format>/`, and `load_checkpoint` reads that mirror whenever it
+is at least as new as the pickle:
+
+- `.feather` – Arrow IPC. Loaded with memory-mapping; with compression
+  `none` the columns are used straight from the page cache (no unpickling).
+- `.parquet` – compressed columnar files, smallest on disk.
+- `.joblib` – the toolkit's default pickles.
+
+Compression defaults come from `.env` (`CHECKPOINT_COMPRESSION`,
+`CHECKPOINT_COMPRESSION_LEVEL`) or the process environment.
+
+Usage:
+    from src.checkpoint_io import export_checkpoint, load_checkpoint, save_checkpoint
+
+    path = cfg["settings"]["checkpoint"]["checkpoint_path"]
+    export_checkpoint(path, run_id=run_id)          # after the module ran
+    df = load_checkpoint(path, run_id=run_id)       # reads the mirror when current
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _setting(key: str) -> str:
+    """Read a setting from the environment, falling back to the project .env."""
+    if os.environ.get(key):
+        return os.environ[key].strip()
+    envf = PROJECT_ROOT / ".env"
+    if envf.exists():
+        m = re.search(rf"^{key}=(.*)$", envf.read_text(encoding="utf-8"), flags=re.M)
+        if m:
+            return m.group(1).strip()
+    return ""
+
+
+def _resolve(path: str, run_id: Optional[str]) -> Path:
+    p = Path(path.format(run_id=run_id) if run_id else path)
+    return p if p.is_absolute() else PROJECT_ROOT / p
+
+
+def mirror_path(path: Path) -> Path:
+    """Where `export_checkpoint` mirrors a joblib checkpoint (itself for joblib)."""
+    fmt = _setting("CHECKPOINT_FORMAT") or "joblib"
+    if fmt == "joblib" or path.suffix != ".joblib":
+        return path
+    parts = ["exports" if p == "exports" else (fmt if p == "joblib" else p) for p in path.parts]
+    if parts == list(path.parts):
+        return path
+    return Path(*parts).with_suffix(f".{fmt}")
+
+
+def save_checkpoint(df: pd.DataFrame, path: str, run_id: Optional[str] = None) -> Path:
+    """Write `df` to `path` in the format named by its extension."""
+    target = _resolve(path, run_id)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    codec = _setting("CHECKPOINT_COMPRESSION") or None
+    level = int(_setting("CHECKPOINT_COMPRESSION_LEVEL")) if _setting("CHECKPOINT_COMPRESSION_LEVEL") else None
+    if target.suffix == ".feather":
+        import pyarrow.feather as feather
+
+        if codec == "none":
+            feather.write_feather(df, str(target), compression="uncompressed")
+        else:
+            feather.write_feather(df, str(target), compression=codec or "lz4", compression_level=level)
+    elif target.suffix == ".parquet":
+        df.to_parquet(target, compression=None if codec == "none" else (codec or "zstd"), compression_level=level)
+    else:
+        import joblib
+
+        if codec == "none":
+            joblib.dump(df, target, compress=0)
+        elif codec:
+            joblib.dump(df, target, compress=(codec, level if level is not None else 3))
+        else:
+            joblib.dump(df, target, compress=level or 0)
+    return target
+
+
+def export_checkpoint(path: str, run_id: Optional[str] = None) -> Path:
+    """Mirror a toolkit joblib checkpoint in the project's checkpoint format."""
+    import joblib
+
+    source = _resolve(path, run_id)
+    target = mirror_path(source)
+    if target == source:
+        return source
+    return save_checkpoint(joblib.load(source), str(target))
+
+
+def load_checkpoint(path: str, run_id: Optional[str] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load a checkpoint written by `save_checkpoint` (or by the toolkit)."""
+    source = _resolve(path, run_id)
+    mirror = mirror_path(source)
+    if mirror != source and mirror.exists() and (not source.exists() or mirror.stat().st_mtime >= source.stat().st_mtime):
+        source = mirror
+    if source.suffix == ".feather":
+        import pyarrow.feather as feather
+
+        return feather.read_table(str(source), columns=columns, memory_map=True).to_pandas()
+    if source.suffix == ".parquet":
+        return pd.read_parquet(source, columns=columns)
+    import joblib
+
+    df = joblib.load(source)
+    return df[columns] if columns else df
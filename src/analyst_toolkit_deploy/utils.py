@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import re
 import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import IO, Any, Callable, Dict, Iterable, Optional
 
 import yaml
 
+# Prefer the libyaml-backed codecs; fall back to pure Python when PyYAML was
+# built without libyaml. Both are "safe" (plain data types only).
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def ensure_dir(p: Path) -> None:
     """Create a directory (and parents) if missing, and drop a .gitkeep.
@@ -26,35 +36,66 @@ def ensure_dir(p: Path) -> None:
             pass
 
 
-def copy_file(src: Path, dst: Path, overwrite: bool = True) -> None:
-    """Copy a file with parent creation and overwrite control.
+def yaml_load(stream) -> Any:
+    """Safe-load YAML from a string or file object (C loader when available)."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def yaml_dump(data: Any, stream: Optional[IO[str]] = None) -> Optional[str]:
+    """Safe-dump YAML with stable, readable formatting (C dumper when available).
 
-    If `overwrite` is False and the destination exists, the copy is skipped.
-    Uses `shutil.copy2` to preserve metadata where possible.
+    Returns the text when `stream` is None, mirroring `yaml.safe_dump`.
     """
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.exists() and not overwrite:
-        return
-    shutil.copy2(src, dst)
+    return yaml.dump(data, stream, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
 
 
-def update_yaml_key(path: Path, key: str, value) -> None:
-    """Update (or insert) a top-level YAML key in-place.
+def update_yaml_keys(path: Path, values: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> None:
+    """Update top-level YAML keys with a single read-modify-write.
 
-    No-op if the file does not exist. Falls back to an empty mapping on read
-    errors to avoid hard failure. Writes human-friendly YAML (no key sorting).
+    `values` always overwrite; `defaults` only fill keys that are missing or
+    empty. No-op if the file does not exist. Falls back to an empty mapping
+    on read errors to avoid hard failure.
     """
     if not path.exists():
         return
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = yaml_load(path.read_text(encoding="utf-8")) or {}
     except Exception:
         data = {}
-    data[key] = value
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=False, allow_unicode=True),
-        encoding="utf-8",
-    )
+    data.update(values)
+    for key, value in (defaults or {}).items():
+        if not data.get(key):
+            data[key] = value
+    path.write_text(yaml_dump(data) or "", encoding="utf-8")
+
+
+def replace_yaml_scalars(path: Path, keys: Iterable[str], transform: Callable[[str], Optional[str]]) -> int:
+    """Rewrite scalar values of the given keys in a YAML file, line by line.
+
+    Unlike a load/dump round-trip this keeps comments, quoting and layout
+    intact, which matters for the annotated template configs. `transform`
+    receives the unquoted value and returns a replacement, or None to keep
+    it. Returns the number of values changed (0 if the file is missing).
+    """
+    if not path.exists():
+        return 0
+    pattern = re.compile(r"^(\s*(?:%s):\s*)([\"']?)([^\"'#\n]*?)\2(\s*(?:#.*)?)$" % "|".join(re.escape(k) for k in keys))
+    changed = 0
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        body = line.rstrip("\r\n")
+        m = pattern.match(body)
+        if not m or not m.group(3):
+            continue
+        new = transform(m.group(3))
+        if new is None or new == m.group(3):
+            continue
+        quote = m.group(2) or '"'
+        lines[i] = f"{m.group(1)}{quote}{new}{quote}{m.group(4)}{line[len(body):]}"
+        changed += 1
+    if changed:
+        path.write_text("".join(lines), encoding="utf-8")
+    return changed
 
 
 def run(
@@ -0,0 +1,225 @@
+"""Watch mode: regenerate autofill configs as new extracts land.
+
+One warm process watches the input folder (inotify on Linux, polling
+elsewhere), waits until a new or rewritten CSV has stopped growing, then
+regenerates the configs. Per-file profiles stay cached between runs, so a
+drop only re-profiles the files that changed before the merge. A
+single-slot work queue coalesces bursts: drops arriving while a
+regeneration runs are folded into the next one.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import queue
+import select
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from rich import print
+
+from . import infer_configs as ic
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MOVED_FROM = 0x00000040
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _inotify_open(directory: str) -> Optional[int]:
+    """Open an inotify descriptor watching `directory`, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+    if fd < 0:
+        return None
+    mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_MOVED_FROM
+    if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _inotify_read(fd: int, timeout: float) -> Set[str]:
+    """Return names touched since the last read, waiting up to `timeout`."""
+    ready, _, _ = select.select([fd], [], [], timeout)
+    names: Set[str] = set()
+    if not ready:
+        return names
+    try:
+        data = os.read(fd, 64 * 1024)
+    except BlockingIOError:
+        return names
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+        start = offset + _EVENT_HEADER.size
+        name = data[start : start + length].rstrip(b"\0")
+        if name:
+            names.add(os.fsdecode(name))
+        offset = start + length
+    return names
+
+
+def _snapshot(directory: str, pattern: str) -> Dict[str, Tuple[int, int]]:
+    """Map matching file names to (size, mtime_ns) for polling."""
+    snap = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                st = entry.stat()
+                snap[entry.name] = (st.st_size, st.st_mtime_ns)
+    return snap
+
+
+def _file_key(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def watch(
+    root: str,
+    input_path: str | None = None,
+    outdir: str | None = None,
+    settle: float = 2.0,
+    poll_interval: float = 1.0,
+    exclude_patterns: str = "id|uuid|tag",
+    datetime_hints: List[str] | None = None,
+    max_workers: int | None = None,
+    use_inotify: bool = True,
+    stop: threading.Event | None = None,
+    on_regenerate: Callable[[Dict[str, Any]], None] | None = None,
+    float32: bool = False,
+    **profile_kwargs: Any,
+) -> None:
+    """Watch `input_path` (a folder or glob; default `data/raw`) and keep configs current.
+
+    A file counts as complete once its size and mtime have not changed for
+    `settle` seconds. Runs until `stop` is set or the process is
+    interrupted. `on_regenerate` receives a summary dict after each run;
+    `profile_kwargs` are forwarded to `profile_csv`.
+    """
+    root = os.path.abspath(root)
+    target = input_path or os.path.join(root, "data", "raw")
+    if os.path.isdir(target):
+        directory, pattern = target, "*.csv"
+        glob_path = os.path.join(target, "*.csv")
+    else:
+        directory, pattern = os.path.dirname(target) or ".", os.path.basename(target)
+        glob_path = target
+    if not os.path.isdir(directory):
+        raise RuntimeError(f"Watch folder not found: {directory}")
+    rel_path = os.path.relpath(glob_path, root)
+    stop = stop or threading.Event()
+
+    cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    pending: Set[str] = set()
+    lock = threading.Lock()
+    # One slot: a queued token means "regenerate"; later drops just join `pending`
+    work: "queue.Queue[bool]" = queue.Queue(maxsize=1)
+
+    def regenerate(trigger: Set[str]) -> None:
+        start = time.perf_counter()
+        files = ic.expand_inputs(glob_path)
+        # Keys are taken before profiling: a file rewritten mid-read keeps its
+        # old key, so the next pass sees the change and re-profiles it
+        keys = {f: _file_key(f) for f in files}
+        stale = [f for f in files if f not in cache or cache[f][0] != keys[f]]
+        for f in list(cache):
+            if f not in files:
+                del cache[f]
+        if stale:
+            fresh = ic.profile_partitions(stale, max_workers=max_workers, datetime_hints=datetime_hints, **profile_kwargs)
+            for f, prof in fresh.items():
+                key = keys[f]
+                if key is not None:
+                    cache[f] = (key, prof)
+        parts = {f: cache[f][1] for f in files if f in cache}
+        if not parts:
+            print(f"[yellow]No CSV files match {rel_path}; waiting for data[/yellow]")
+            return
+        out = ic.write_outputs(root, rel_path, parts, outdir, exclude_patterns, datetime_hints, float32=float32)
+        summary = {
+            "files": len(parts),
+            "reprofiled": len(stale),
+            "trigger": sorted(os.path.basename(t) for t in trigger),
+            "seconds": round(time.perf_counter() - start, 2),
+            "outdir": out["outdir"],
+        }
+        print(f"[green]Regenerated configs[/green] from {summary['files']} file(s), {summary['reprofiled']} re-profiled in {summary['seconds']}s")
+        if on_regenerate:
+            on_regenerate(summary)
+
+    def worker() -> None:
+        while not stop.is_set():
+            try:
+                work.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            with lock:
+                batch = set(pending)
+                pending.clear()
+            try:
+                regenerate(batch)
+            except Exception as e:  # keep watching after a bad drop
+                print(f"[red]Regeneration failed:[/red] {e}")
+
+    def enqueue(paths: Set[str]) -> None:
+        with lock:
+            pending.update(paths)
+        try:
+            work.put_nowait(True)
+        except queue.Full:
+            pass  # a regeneration is already queued and will pick these up
+
+    fd = _inotify_open(directory) if use_inotify else None
+    print(f"[green]Watching[/green] {os.path.relpath(directory, root)}/{pattern} ({'inotify' if fd is not None else 'polling'}, settle {settle}s)")
+    thread = threading.Thread(target=worker, name="infer-watch", daemon=True)
+    thread.start()
+    enqueue(set())
+
+    seen = _snapshot(directory, pattern)
+    candidates: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+    tick = min(poll_interval, settle / 2) if settle > 0 else poll_interval
+    try:
+        while not stop.is_set():
+            if fd is not None:
+                touched = {n for n in _inotify_read(fd, tick) if fnmatch.fnmatch(n, pattern)}
+            else:
+                stop.wait(tick)
+                current = _snapshot(directory, pattern)
+                touched = {n for n in set(current) | set(seen) if current.get(n) != seen.get(n)}
+                seen = current
+            now = time.monotonic()
+            for name in touched:
+                path = os.path.join(directory, name)
+                candidates[path] = (_file_key(path), now)
+            ready = set()
+            for path, (key, since) in list(candidates.items()):
+                current_key = _file_key(path)
+                if current_key != key:
+                    candidates[path] = (current_key, now)
+                elif now - since >= settle:
+                    ready.add(path)
+                    del candidates[path]
+            if ready:
+                enqueue(ready)
+    finally:
+        stop.set()
+        if fd is not None:
+            os.close(fd)
+        thread.join()
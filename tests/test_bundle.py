@@ -0,0 +1,24 @@
+from contextlib import contextmanager
+
+import pytest
+
+from analyst_toolkit_deploy import bootstrap
+from analyst_toolkit_deploy.bundle import open_templates
+
+
+def test_loose_templates_have_no_version():
+    with open_templates() as (manifest, members):
+        names = [rel for rel, _ in members]
+    assert manifest["version"] == ""
+    assert "config/run_toolkit_config.yaml" in names
+    assert not any("__pycache__" in rel for rel in names)
+
+
+def test_stale_archive_is_refused(tmp_path, monkeypatch):
+    @contextmanager
+    def stale():
+        yield {"version": "0.0.0", "files": []}, iter(())
+
+    monkeypatch.setattr(bootstrap, "open_templates", stale)
+    with pytest.raises(RuntimeError, match="0.0.0"):
+        bootstrap._copy_templates(tmp_path, force=False, project_name="", vscode_ai="none", copy_notebook=False)
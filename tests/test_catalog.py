@@ -0,0 +1,66 @@
+import codecs
+import os
+
+import pytest
+
+from analyst_toolkit_deploy import catalog
+from analyst_toolkit_deploy.bootstrap import _wire_dataset
+from analyst_toolkit_deploy.utils import yaml_load
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "proj"
+    (root / "config").mkdir(parents=True)
+    (root / "data" / "raw").mkdir(parents=True)
+    (root / "config" / "run_toolkit_config.yaml").write_text("pipeline_entry_path: data/raw/placeholder.csv\n")
+    return root
+
+
+def _entry_path(root):
+    with open(root / "config" / "run_toolkit_config.yaml") as f:
+        return yaml_load(f)["pipeline_entry_path"]
+
+
+def test_refresh_is_incremental_and_prunes_vanished_files(project):
+    raw = project / "data" / "raw"
+    (raw / "a.csv").write_text("id,city\n1,Oslo\n2,Rome\n")
+    (raw / "b.csv").write_text("id\n1\n")
+    first = {e["name"]: e for e in catalog.refresh_catalog(project)}
+    assert first["a.csv"]["rows"] == 2
+    assert first["a.csv"]["columns"] == ["id", "city"]
+
+    (raw / "b.csv").unlink()
+    second = {e["name"]: e for e in catalog.refresh_catalog(project)}
+    assert list(second) == ["a.csv"]
+    assert second["a.csv"]["indexed_at"] == first["a.csv"]["indexed_at"]
+
+
+def test_header_hash_ignores_bom():
+    assert catalog.header_hash(codecs.BOM_UTF8 + b"id,city") == catalog.header_hash(b"id,city")
+
+
+def test_schema_query_prefers_newest_match(project):
+    raw = project / "data" / "raw"
+    (raw / "old.csv").write_text("order_id,amount\n1,2\n")
+    (raw / "new.csv").write_text("order_id,amount,city\n1,2,Oslo\n")
+    (raw / "other.csv").write_text("sku\nx\n")
+    os.utime(raw / "old.csv", ns=(1_000_000_000, 1_000_000_000))
+    entries = catalog.refresh_catalog(project)
+    assert [e["name"] for e in catalog.select_datasets(entries, "schema:order_id, amount")] == ["new.csv", "old.csv"]
+    assert [e["name"] for e in catalog.select_datasets(entries, "name:oth*")] == ["other.csv"]
+
+
+def test_wire_dataset_ingests_a_catalog_match(project, tmp_path):
+    extra = tmp_path / "exports"
+    extra.mkdir()
+    (extra / "orders_2024.csv").write_text("order_id,amount\n1,2\n")
+    chosen = _wire_dataset(project, "schema:order_id,amount", catalog_dirs=[extra])
+    assert chosen == project.resolve() / "data" / "raw" / "orders_2024.csv"
+    assert chosen.exists() and (extra / "orders_2024.csv").exists()
+    assert _entry_path(project) == "data/raw/orders_2024.csv"
+
+
+def test_wire_dataset_without_a_match_keeps_the_config(project):
+    assert _wire_dataset(project, "name:missing_*") is None
+    assert _entry_path(project) == "data/raw/placeholder.csv"
@@ -0,0 +1,28 @@
+import pytest
+
+from analyst_toolkit_deploy.bootstrap import _with_pyarrow
+from analyst_toolkit_deploy.checkpoints import check_compression, set_checkpoint_format
+
+
+def test_set_checkpoint_format_creates_export_folder(tmp_path):
+    assert set_checkpoint_format(tmp_path, "feather") == tmp_path / "exports" / "feather"
+    assert (tmp_path / "exports" / "feather" / ".gitkeep").exists()
+
+
+def test_set_checkpoint_format_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        set_checkpoint_format(tmp_path, "pickle")
+
+
+def test_check_compression_validates_codec_per_format():
+    check_compression("feather", "")
+    check_compression("parquet", "snappy")
+    with pytest.raises(ValueError, match="feather"):
+        check_compression("feather", "snappy")
+    with pytest.raises(ValueError):
+        check_compression("joblib", "brotli")
+
+
+def test_pyarrow_added_next_to_pandas():
+    assert list(_with_pyarrow(["numpy\n", "pandas\n", "pyyaml\n"])) == ["numpy\n", "pandas\n", "pyarrow\n", "pyyaml\n"]
+    assert list(_with_pyarrow(["  - pandas\n"])) == ["  - pandas\n", "  - pyarrow\n"]
@@ -0,0 +1,31 @@
+import pandas as pd
+import typer
+from typer.testing import CliRunner
+
+from analyst_toolkit_deploy.cli import deploy_app, infer_configs_cmd
+
+
+def test_deploy_is_the_default_command(tmp_path):
+    result = CliRunner().invoke(deploy_app, ["--target", str(tmp_path / "proj"), "--dataset", "none"])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "proj" / "config" / "run_toolkit_config.yaml").exists()
+
+
+def test_subcommands_are_registered():
+    result = CliRunner().invoke(deploy_app, ["--help"])
+    assert result.exit_code == 0
+    assert "plan" in result.output and "serve" in result.output
+
+
+def test_infer_reports_the_written_summary(tmp_path, monkeypatch):
+    raw = tmp_path / "data" / "raw"
+    raw.mkdir(parents=True)
+    pd.DataFrame({"id": [1, 2], "city": ["Oslo", None]}).to_csv(raw / "orders_1.csv", index=False)
+    pd.DataFrame({"id": [3, 4], "city": ["Rome", "Oslo"]}).to_csv(raw / "orders_2.csv", index=False)
+    monkeypatch.chdir(tmp_path)
+    app = typer.Typer()
+    app.command()(infer_configs_cmd)
+    result = CliRunner().invoke(app, ["--input", "data/raw/orders_*.csv"])
+    assert result.exit_code == 0, result.output
+    assert "Merged 2 partitions" in result.output
+    assert "1 of 2 columns have nulls" in result.output
@@ -0,0 +1,43 @@
+import pytest
+
+from analyst_toolkit_deploy.convert import convert_dataset
+from analyst_toolkit_deploy.utils import yaml_dump, yaml_load
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "config" / "generated").mkdir(parents=True)
+    (tmp_path / "data" / "raw").mkdir(parents=True)
+    (tmp_path / "config" / "run_toolkit_config.yaml").write_text("pipeline_entry_path: data/raw/orders.csv\n")
+    rows = [f"{i},{'abc'[i % 3]},sku-{i % 40}" for i in range(200)]
+    (tmp_path / "data" / "raw" / "orders.csv").write_text("id,grade,sku\n" + "\n".join(rows) + "\n")
+    return tmp_path
+
+
+def _schema(root):
+    return pq.read_schema(str(root / "data" / "processed" / "orders" / "part-00000.parquet"))
+
+
+def test_categoricals_follow_top_n(project):
+    rel = convert_dataset(str(project), str(project / "data" / "raw" / "orders.csv"), max_unique=50, top_n=30)
+    schema = _schema(project)
+    assert rel == "data/processed/orders"
+    assert str(schema.field("grade").type).startswith("dictionary")
+    assert str(schema.field("sku").type) == "string"
+    with open(project / "config" / "run_toolkit_config.yaml") as f:
+        assert yaml_load(f)["pipeline_entry_path"] == rel
+
+
+def test_generated_rules_use_the_same_limit(project):
+    rules = {
+        "expected_types": {"id": "int64", "grade": "object", "sku": "object"},
+        "categorical_values": {"grade": ["a", "b", "c"], "sku": [f"sku-{i}" for i in range(40)]},
+    }
+    gen = project / "config" / "generated" / "validation_config_autofill.yaml"
+    gen.write_text(yaml_dump({"validation": {"schema_validation": {"rules": rules}}}))
+    convert_dataset(str(project), str(project / "data" / "raw" / "orders.csv"), max_unique=50, top_n=30)
+    schema = _schema(project)
+    assert str(schema.field("grade").type).startswith("dictionary")
+    assert str(schema.field("sku").type) == "string"
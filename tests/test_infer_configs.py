@@ -0,0 +1,213 @@
+import pandas as pd
+
+from analyst_toolkit_deploy.infer_configs import (
+    _merge_type,
+    classify_objects,
+    configs_from_profile,
+    infer_configs,
+    infer_dtype_plan,
+    merge_profiles,
+    partition_deviations,
+    profile_frame,
+    summarize_missingness,
+)
+from analyst_toolkit_deploy.utils import yaml_load
+
+
+def test_merge_type_widens_ints_to_floats():
+    assert _merge_type("int64", "int64") == "int64"
+    assert _merge_type("int64", "float64") == "float64"
+    assert _merge_type("float64", "int64") == "float64"
+
+
+def test_merge_type_falls_back_to_object():
+    assert _merge_type("int64", "object") == "object"
+    assert _merge_type("bool", "float64") == "object"
+    assert _merge_type("datetime64[ns]", "object") == "object"
+
+
+def test_merge_profiles_unions_columns_and_sums_counts():
+    a = profile_frame(pd.DataFrame({"id": [1, 2], "city": ["Oslo", "Rome"]}))
+    b = profile_frame(pd.DataFrame({"id": [3], "city": ["Oslo"], "extra": ["x"]}))
+    merged = merge_profiles(a, b)
+    assert merged["rows"] == 3
+    assert merged["columns"] == ["id", "city", "extra"]
+    assert merged["values"]["city"] == {"Oslo": 2, "Rome": 1}
+    assert merged["ranges"]["id"] == {"min": 1.0, "max": 3.0}
+
+
+def test_merge_profiles_reconciles_types_and_rekeys_values():
+    a = profile_frame(pd.DataFrame({"qty": [1, 2]}))
+    b = profile_frame(pd.DataFrame({"qty": [2.5, None]}))
+    merged = merge_profiles(a, b)
+    assert merged["types"]["qty"] == "float64"
+    assert merged["values"]["qty"] == {"1.0": 1, "2.0": 1, "2.5": 1}
+    assert merged["nulls"]["qty"] == 1
+    assert merged["ranges"]["qty"] == {"min": 1.0, "max": 2.5}
+
+
+def test_merge_profiles_drops_numeric_when_one_side_is_text():
+    a = profile_frame(pd.DataFrame({"code": [1, 2]}))
+    b = profile_frame(pd.DataFrame({"code": ["A1", "B2"]}))
+    merged = merge_profiles(a, b)
+    assert merged["types"]["code"] == "object"
+    assert "code" not in merged["numeric"]
+    assert "code" not in merged["ranges"]
+
+
+def test_merge_profiles_keeps_sampled_flag():
+    a = profile_frame(pd.DataFrame({"x": [1]}))
+    b = dict(profile_frame(pd.DataFrame({"x": [2]})), sampled=True)
+    assert merge_profiles(a, b)["sampled"] is True
+
+
+def test_infer_dtype_plan_int_width_bounds():
+    df = pd.DataFrame({"i8": [-128, 127], "i16": [-129, 127], "i32": [0, 2**15], "i64": [0, 2**31]})
+    plan = infer_dtype_plan(profile_frame(df))
+    assert {c: v["dtype"] for c, v in plan["columns"].items()} == {"i8": "int8", "i16": "int16", "i32": "int32", "i64": "int64"}
+    assert plan["read_options"]["dtype"] == {"i8": "int8", "i16": "int16", "i32": "int32"}
+
+
+def test_infer_dtype_plan_nullable_ints_for_integral_floats():
+    plan = infer_dtype_plan(profile_frame(pd.DataFrame({"n": [1.0, None, 300.0]})))
+    assert plan["columns"]["n"]["dtype"] == "Int16"
+
+
+def test_infer_dtype_plan_keeps_int64_for_sampled_profiles():
+    profile = dict(profile_frame(pd.DataFrame({"i": [1, 2], "n": [1.0, None]})), sampled=True)
+    plan = infer_dtype_plan(profile)
+    assert plan["columns"]["i"]["dtype"] == "int64"
+    assert plan["columns"]["n"]["dtype"] == "Int64"
+
+
+def test_infer_dtype_plan_float32_is_opt_in():
+    profile = profile_frame(pd.DataFrame({"price": [1.5, 100.25]}))
+    assert infer_dtype_plan(profile)["columns"]["price"]["dtype"] == "float64"
+    assert infer_dtype_plan(profile, float32=True)["columns"]["price"]["dtype"] == "float32"
+
+
+def _classify(**columns):
+    return classify_objects(profile_frame(pd.DataFrame(columns)))
+
+
+def test_classify_objects_formatted_numbers():
+    out = _classify(price=["$1,200.50", "$3.00"] * 5, rate=["45%", "5%"] * 5)
+    assert out["price"]["kind"] == "numeric"
+    assert out["price"]["dtype"] == "float64"
+    assert out["price"]["formats"] == ["currency", "thousands"]
+    assert out["rate"]["formats"] == ["percent"]
+
+
+def test_classify_objects_sentinels():
+    out = _classify(qty=["1", "2", "3", "4", "5", "6", "7", "8", "9", "N/A"])
+    assert out["qty"] == {"kind": "numeric", "dtype": "Int64", "sentinels": {"N/A": 1}, "formats": [], "stage": "load"}
+
+
+def test_classify_objects_booleans_need_a_worded_token():
+    out = _classify(flag=["yes", "no", "Y", "1", "0"] * 2, bits=["1", "0", "1", "0", "?"] * 2)
+    assert out["flag"]["kind"] == "boolean"
+    assert out["flag"]["tokens"] == {"yes": True, "no": False, "Y": True, "1": True, "0": False}
+    assert out["bits"]["kind"] == "numeric"
+    assert out["bits"]["sentinels"] == {"?": 2}
+
+
+def test_classify_objects_skips_codes_and_free_text():
+    out = _classify(zip=["00123", "04567"] * 5, name=["Ann", "Bob"] * 5)
+    assert out == {}
+
+
+def _load_and_normalize(path, configs, plan):
+    # What the pipeline does: read with the plan's read_options, then the
+    # toolkit's normalization (value_mappings, then coerce_dtypes)
+    df = pd.read_csv(path, **plan["read_options"])
+    rules = configs["normalization"]["normalization"]["rules"]
+    for col, mapping in rules["value_mappings"].items():
+        df[col] = df[col].map(lambda v: mapping.get(v, v) if isinstance(v, str) else v)
+    return df.astype(rules["coerce_dtypes"])
+
+
+def test_formatted_numbers_are_coerced_on_the_load_path(tmp_path):
+    path = tmp_path / "sales.csv"
+    pd.DataFrame(
+        {
+            "rate": ["45.0%", "12.5%", "unknown", "3%", "8%"] + ["10%"] * 5,
+            "price": ["$12.50", "$1,200.00", "$3.10", "$7", "$9"] * 2,
+            "units": ["1,234", "12", "N/A", "5,000", "7"] + ["9"] * 5,
+            "flag": ["yes", "no"] * 5,
+        }
+    ).to_csv(path, index=False)
+    profile = profile_frame(pd.read_csv(path))
+    configs = configs_from_profile(profile)
+    plan = infer_dtype_plan(profile)
+    df = _load_and_normalize(path, configs, plan)
+    expected = configs["certification"]["validation"]["schema_validation"]["rules"]["expected_types"]
+    assert {c: str(t) for c, t in df.dtypes.items()} == expected == {"rate": "float64", "price": "float64", "units": "float64", "flag": "bool"}
+    assert df["rate"].tolist()[:2] == [0.45, 0.125] and df["rate"].isna().sum() == 1
+    assert df["price"].tolist()[:2] == [12.5, 1200.0]
+    assert df["units"].tolist()[:2] == [1234.0, 12.0] and df["units"].isna().sum() == 1
+    assert "numeric_formats" not in configs["normalization"]["normalization"]["rules"]
+
+
+def test_capped_currency_columns_stay_object():
+    profile = profile_frame(pd.DataFrame({"amount": [f"${i},000.50" for i in range(1, 1201)]}))
+    info = classify_objects(profile)["amount"]
+    assert info["stage"] is None
+    rules = configs_from_profile(profile)["certification"]["validation"]["schema_validation"]["rules"]
+    assert rules["expected_types"] == {"amount": "object"}
+
+
+def _project(tmp_path, entry):
+    (tmp_path / "data" / "raw").mkdir(parents=True)
+    (tmp_path / "config").mkdir()
+    pd.DataFrame({"qty": [1, 2, 3], "city": ["Oslo", "Oslo", "Rome"]}).to_csv(tmp_path / "data" / "raw" / "orders.csv", index=False)
+    (tmp_path / "config" / "run_toolkit_config.yaml").write_text(f"pipeline_entry_path: {entry}\nrun_id: r1\n", encoding="utf-8")
+    return tmp_path / "config" / "run_toolkit_config.yaml"
+
+
+def test_infer_writes_read_options_into_run_config(tmp_path):
+    run_cfg = _project(tmp_path, "data/raw/orders.csv")
+    infer_configs(str(tmp_path))
+    cfg = yaml_load(run_cfg.read_text(encoding="utf-8"))
+    plan = yaml_load((tmp_path / "config" / "generated" / "dtype_plan_autofill.yaml").read_text(encoding="utf-8"))
+    assert cfg["run_id"] == "r1"
+    assert cfg["read_options"] == plan["read_options"]
+    assert cfg["read_options"]["dtype"]["qty"] == "int8"
+    assert len(pd.read_csv(tmp_path / cfg["pipeline_entry_path"], **cfg["read_options"])) == 3
+
+
+def test_infer_leaves_run_config_alone_for_other_inputs(tmp_path):
+    run_cfg = _project(tmp_path, "data/raw/other.csv")
+    before = run_cfg.read_text(encoding="utf-8")
+    infer_configs(str(tmp_path), input_path=str(tmp_path / "data" / "raw" / "orders.csv"))
+    assert run_cfg.read_text(encoding="utf-8") == before
+
+
+def test_partition_deviations_only_flag_validated_categories():
+    parts = {
+        f"part{i}.csv": profile_frame(
+            pd.DataFrame(
+                {
+                    "status": ["open", "closed"] * 50 + (["void"] if i else []),
+                    "note": [f"free text {i}-{n}" for n in range(100 + i)],
+                    "when": pd.date_range(f"2024-0{i + 1}-01", periods=100 + i).astype(str),
+                }
+            )
+        )
+        for i in range(2)
+    }
+    merged = merge_profiles(*parts.values())
+    report = partition_deviations(parts, merged)
+    assert report == {"part1.csv": ["exclusive categories: status ['void']"]}
+    assert configs_from_profile(merged)["validation"]["validation"]["schema_validation"]["rules"]["categorical_values"] == {
+        "status": ["closed", "open", "void"]
+    }
+
+
+def test_missingness_pairs_and_patterns_merge_across_partitions():
+    a = profile_frame(pd.DataFrame({"zip": [None, "1", None], "city": [None, "Oslo", None], "qty": [1, 2, None]}))
+    b = profile_frame(pd.DataFrame({"zip": [None], "city": [None], "qty": [4]}))
+    miss = summarize_missingness(merge_profiles(a, b))
+    assert miss["rows"] == 4 and miss["complete_rows"] == 1
+    assert miss["null_rates"] == {"zip": 0.75, "city": 0.75, "qty": 0.25}
+    assert miss["co_missing"][0] == {"columns": ["city", "zip"], "rows": 3, "jaccard": 1.0}
+    assert miss["patterns"][0] == {"columns": ["city", "zip"], "rows": 2, "share": 0.5}
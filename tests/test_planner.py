@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from analyst_toolkit_deploy.cli import deploy_app
+from analyst_toolkit_deploy.planner import plan_pipeline
+
+
+@pytest.fixture
+def orders_csv(tmp_path):
+    path = tmp_path / "orders.csv"
+    pd.DataFrame({"order_id": range(500), "city": ["Oslo", "Rome"] * 250, "amount": [1.5] * 500}).to_csv(path, index=False)
+    return path
+
+
+def test_plan_with_input_needs_no_run_config(tmp_path, orders_csv):
+    report = plan_pipeline(str(tmp_path), input_path=str(orders_csv), sample_rows=100)
+    assert report["rows"] == 500
+    assert report["columns"] == 3
+    assert report["modules"] == []
+
+
+def test_plan_without_run_config_or_input_is_a_clear_error(tmp_path):
+    with pytest.raises(RuntimeError, match="run_toolkit_config.yaml"):
+        plan_pipeline(str(tmp_path))
+
+
+def test_plan_missing_input_is_a_clear_error(tmp_path):
+    with pytest.raises(RuntimeError, match="not found"):
+        plan_pipeline(str(tmp_path), input_path=str(tmp_path / "missing.csv"))
+
+
+def test_plan_cli_reports_errors_without_traceback(tmp_path):
+    result = CliRunner().invoke(deploy_app, ["plan", "--target", str(tmp_path)])
+    assert result.exit_code == 2
+    assert "No run config" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_plan_cli_with_input_outside_a_project(tmp_path, orders_csv):
+    result = CliRunner().invoke(deploy_app, ["plan", "--target", str(tmp_path), "--input", str(orders_csv), "--json"])
+    assert result.exit_code == 0, result.output
+    assert '"rows": 500' in result.output
@@ -0,0 +1,73 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("fsspec")
+pytest.importorskip("aiohttp")
+
+from analyst_toolkit_deploy.remote import prune_cache, read_csv_sample  # noqa: E402
+
+ROWS = 200_000
+
+
+class _RangeHandler(SimpleHTTPRequestHandler):
+    """Static files with single-range GET support (like S3/GCS/CDNs)."""
+
+    def do_GET(self):
+        spec = self.headers.get("Range")
+        if not spec:
+            return super().do_GET()
+        path = self.translate_path(self.path)
+        size = os.path.getsize(path)
+        start, _, end = spec.removeprefix("bytes=").partition("-")
+        first, last = int(start), min(int(end) if end else size - 1, size - 1)
+        with open(path, "rb") as f:
+            f.seek(first)
+            data = f.read(last - first + 1)
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {first}-{last}/{size}")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def served_csv(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("http")
+    with open(folder / "orders.csv", "w", encoding="utf-8") as f:
+        f.write("order_id,city,amount\n")
+        f.writelines(f"{100_000 + i},{'Oslo' if i % 3 else 'Rio de Janeiro'},{i % 90 + 10}.25\n" for i in range(ROWS))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_RangeHandler, directory=str(folder)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/orders.csv"
+    server.shutdown()
+
+
+@pytest.mark.parametrize("sample_rows", [None, 1_000, 50_000])
+def test_estimated_rows_close_to_actual(served_csv, tmp_path, sample_rows):
+    df, stats = read_csv_sample(served_csv, sample_rows=sample_rows, block_size=1 << 16, cache=tmp_path)
+    assert len(df) == (sample_rows or len(df))
+    assert abs(stats["estimated_rows"] - ROWS) / ROWS < 0.05
+    assert stats["bytes_read"] < stats["size"]
+
+
+def test_repeat_reads_come_from_the_block_cache(served_csv, tmp_path):
+    _, first = read_csv_sample(served_csv, sample_rows=1_000, block_size=1 << 16, cache=tmp_path)
+    _, second = read_csv_sample(served_csv, sample_rows=1_000, block_size=1 << 16, cache=tmp_path)
+    assert first["bytes_fetched"] > 0
+    assert second["bytes_fetched"] == 0
+
+
+def test_prune_cache_evicts_least_recently_used(tmp_path):
+    for i, name in enumerate(["old", "mid", "new"]):
+        blk = tmp_path / f"{name}.blk"
+        blk.write_bytes(b"x" * 100)
+        os.utime(blk, ns=(i * 10**9, i * 10**9))
+    assert prune_cache(tmp_path, max_bytes=150) == 200
+    assert [p.name for p in tmp_path.glob("*.blk")] == ["new.blk"]
@@ -0,0 +1,76 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from analyst_toolkit_deploy.service import ProfileService, _make_handler
+from analyst_toolkit_deploy.utils import yaml_load
+
+
+@pytest.fixture(scope="module")
+def root(tmp_path_factory):
+    root = tmp_path_factory.mktemp("served")
+    (root / "config").mkdir()
+    (root / "data" / "raw").mkdir(parents=True)
+    (root / "config" / "run_toolkit_config.yaml").write_text("pipeline_entry_path: data/raw/orders.csv\n")
+    (root / "data" / "raw" / "orders.csv").write_text("id,price\n" + "".join(f"{i},{i}.5\n" for i in range(50)))
+    return root
+
+
+@pytest.fixture(scope="module")
+def post(root):
+    service = ProfileService(workers=1, root=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(service))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def call(endpoint, body):
+        req = urllib.request.Request(f"http://127.0.0.1:{server.server_port}{endpoint}", data=json.dumps(body).encode(), method="POST")
+        try:
+            with urllib.request.urlopen(req) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    yield call
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def test_profile_is_cached_by_fingerprint(post):
+    status, first = post("/profile", {"path": "data/raw/orders.csv"})
+    assert status == 200 and first["result"]["rows"] == 50
+    assert post("/profile", {"path": "data/raw/orders.csv"})[1]["result"] == first["result"]
+
+
+@pytest.mark.parametrize(
+    "endpoint, body",
+    [
+        ("/profile", {"path": "/etc/passwd"}),
+        ("/profile", {"path": "../outside.csv"}),
+        ("/infer", {"root": "..", "input_path": "x.csv"}),
+        ("/infer", {"root": ".", "outdir": "../elsewhere"}),
+        ("/check", {"root": ".", "input_path": "/etc/hosts"}),
+    ],
+)
+def test_paths_outside_root_are_forbidden(post, endpoint, body):
+    status, payload = post(endpoint, body)
+    assert status == 403
+    assert "outside the service root" in payload["error"]
+
+
+def test_error_status_codes(post):
+    assert post("/profile", {})[0] == 400
+    assert post("/nope", {})[0] == 404
+    assert post("/check", {"root": ".", "outdir": "missing"})[0] == 422
+
+
+def test_infer_forwards_float32(post, root):
+    status, payload = post("/infer", {"root": ".", "float32": True})
+    assert status == 200
+    with open(root / "config" / "generated" / "dtype_plan_autofill.yaml") as f:
+        assert yaml_load(f)["columns"]["price"]["dtype"] == "float32"
+    assert post("/check", {"root": "."})[1]["result"]["drift"] == []
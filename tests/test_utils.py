@@ -0,0 +1,36 @@
+from analyst_toolkit_deploy.utils import replace_yaml_scalars
+
+
+def test_replace_yaml_scalars_keeps_comments_and_quotes(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        "# header comment\n"
+        'input_path: "data/raw/old.csv"  # wired by deploy\n'
+        "nested:\n"
+        "  input_path: 'data/raw/old.csv'\n"
+        "  raw_data_path: data/raw/old.csv\n"
+        "other_path: data/raw/old.csv\n",
+        encoding="utf-8",
+    )
+    changed = replace_yaml_scalars(cfg, ["input_path", "raw_data_path"], lambda v: "data/processed/new" if v.endswith(".csv") else None)
+    assert changed == 3
+    assert cfg.read_text(encoding="utf-8") == (
+        "# header comment\n"
+        'input_path: "data/processed/new"  # wired by deploy\n'
+        "nested:\n"
+        "  input_path: 'data/processed/new'\n"
+        '  raw_data_path: "data/processed/new"\n'
+        "other_path: data/raw/old.csv\n"
+    )
+
+
+def test_replace_yaml_scalars_leaves_file_untouched_without_changes(tmp_path):
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("input_path: ''\ncheckpoint_path: keep.joblib\r\n", encoding="utf-8")
+    mtime = cfg.stat().st_mtime_ns
+    assert replace_yaml_scalars(cfg, ["input_path", "checkpoint_path"], lambda v: None) == 0
+    assert cfg.stat().st_mtime_ns == mtime
+
+
+def test_replace_yaml_scalars_missing_file(tmp_path):
+    assert replace_yaml_scalars(tmp_path / "missing.yaml", ["input_path"], lambda v: v) == 0